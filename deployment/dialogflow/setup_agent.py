@@ -54,6 +54,12 @@ from google.cloud.dialogflowcx_v3.types import (
     EventHandler,
     Webhook
 )
+from google.cloud.dialogflowcx_v3.services.agents.transports import AgentsGrpcTransport
+from google.cloud.dialogflowcx_v3.services.intents.transports import IntentsGrpcTransport
+from google.cloud.dialogflowcx_v3.services.entity_types.transports import EntityTypesGrpcTransport
+from google.cloud.dialogflowcx_v3.services.pages.transports import PagesGrpcTransport
+from google.cloud.dialogflowcx_v3.services.flows.transports import FlowsGrpcTransport
+from google.cloud.dialogflowcx_v3.services.webhooks.transports import WebhooksGrpcTransport
 from google.api_core.client_options import ClientOptions
 from google.protobuf import field_mask_pb2
 from loguru import logger
@@ -91,41 +97,81 @@ class DialogflowSetup:
         self.api_endpoint = f"{location}-dialogflow.googleapis.com"
         self.client_options = ClientOptions(api_endpoint=self.api_endpoint)
 
-        # Initialize clients
-        self.agents_client = AgentsClient(client_options=self.client_options)
-        self.intents_client = IntentsClient(client_options=self.client_options)
-        self.entity_types_client = EntityTypesClient(client_options=self.client_options)
-        self.pages_client = PagesClient(client_options=self.client_options)
-        self.flows_client = FlowsClient(client_options=self.client_options)
-        self.webhooks_client = WebhooksClient(client_options=self.client_options)
+        # Initialize clients over one shared gRPC channel so setup pays for a
+        # single TLS handshake and credential fetch instead of one per client
+        self.channel = IntentsGrpcTransport.create_channel(
+            self.api_endpoint,
+            scopes=IntentsGrpcTransport.AUTH_SCOPES
+        )
+        self.agents_client = AgentsClient(
+            transport=AgentsGrpcTransport(host=self.api_endpoint, channel=self.channel)
+        )
+        self.intents_client = IntentsClient(
+            transport=IntentsGrpcTransport(host=self.api_endpoint, channel=self.channel)
+        )
+        self.entity_types_client = EntityTypesClient(
+            transport=EntityTypesGrpcTransport(host=self.api_endpoint, channel=self.channel)
+        )
+        self.pages_client = PagesClient(
+            transport=PagesGrpcTransport(host=self.api_endpoint, channel=self.channel)
+        )
+        self.flows_client = FlowsClient(
+            transport=FlowsGrpcTransport(host=self.api_endpoint, channel=self.channel)
+        )
+        self.webhooks_client = WebhooksClient(
+            transport=WebhooksGrpcTransport(host=self.api_endpoint, channel=self.channel)
+        )
 
         # Cache for lookups
         self._entity_types_cache = {}
         self._intents_cache = {}
 
+        # Snapshots of resources that already exist on the agent, keyed by
+        # display name. Listed once so each lookup doesn't cost an API call
+        # against the 60 requests/minute Dialogflow CX quota.
+        self._existing_entity_types: Optional[Dict[str, EntityType]] = None
+        self._existing_intents: Optional[Dict[str, Intent]] = None
+
+    def _get_existing_entity_types(self) -> Dict[str, EntityType]:
+        """List the agent's entity types once and index them by display name."""
+        if self._existing_entity_types is None:
+            self._existing_entity_types = {
+                entity_type.display_name: entity_type
+                for entity_type in self.entity_types_client.list_entity_types(parent=self.agent_path)
+            }
+        return self._existing_entity_types
+
+    def _get_existing_intents(self) -> Dict[str, Intent]:
+        """List the agent's intents once and index them by display name."""
+        if self._existing_intents is None:
+            self._existing_intents = {
+                intent.display_name: intent
+                for intent in self.intents_client.list_intents(parent=self.agent_path)
+            }
+        return self._existing_intents
+
     def get_or_create_entity_type(self, display_name: str, entities: List[Dict]) -> EntityType:
         """Get existing entity type or create new one."""
         if display_name in self._entity_types_cache:
             return self._entity_types_cache[display_name]
 
         # Try to find existing
-        entity_types_list = list(self.entity_types_client.list_entity_types(parent=self.agent_path))
-        for entity_type in entity_types_list:
-            if entity_type.display_name == display_name:
-                logger.info(f"  Found existing entity type: {display_name}")
-
-                # Update it with new entities
-                entity_type.entities.clear()
-                entity_type.entities.extend([
-                    EntityType.Entity(value=e["value"], synonyms=e["synonyms"])
-                    for e in entities
-                ])
-                entity_type.enable_fuzzy_extraction = True
+        entity_type = self._get_existing_entity_types().get(display_name)
+        if entity_type is not None:
+            logger.info(f"  Found existing entity type: {display_name}")
 
-                updated = self.entity_types_client.update_entity_type(entity_type=entity_type)
-                logger.info(f"  ✓ Updated entity type with {len(entities)} entities")
-                self._entity_types_cache[display_name] = updated
-                return updated
+            # Update it with new entities
+            entity_type.entities.clear()
+            entity_type.entities.extend([
+                EntityType.Entity(value=e["value"], synonyms=e["synonyms"])
+                for e in entities
+            ])
+            entity_type.enable_fuzzy_extraction = True
+
+            updated = self.entity_types_client.update_entity_type(entity_type=entity_type)
+            logger.info(f"  ✓ Updated entity type with {len(entities)} entities")
+            self._entity_types_cache[display_name] = updated
+            return updated
 
         # Create new
         logger.info(f"  Creating new entity type: {display_name}")
@@ -158,42 +204,41 @@ class DialogflowSetup:
             return self._intents_cache[display_name]
 
         # Try to find existing
-        intents_list = list(self.intents_client.list_intents(parent=self.agent_path))
-        for intent in intents_list:
-            if intent.display_name == display_name:
-                logger.info(f"  Found existing intent: {display_name}")
-
-                # Update training phrases
-                intent.training_phrases.clear()
-                intent.training_phrases.extend([
-                    Intent.TrainingPhrase(
-                        parts=[
-                            Intent.TrainingPhrase.Part(
-                                text=part["text"],
-                                parameter_id=part.get("parameter_id")
-                            )
-                            for part in phrase
-                        ],
-                        repeat_count=1
-                    )
-                    for phrase in training_phrases
-                ])
+        intent = self._get_existing_intents().get(display_name)
+        if intent is not None:
+            logger.info(f"  Found existing intent: {display_name}")
 
-                # Update parameters if provided
-                if parameters:
-                    intent.parameters.clear()
-                    intent.parameters.extend([
-                        Intent.Parameter(
-                            id=param["id"],
-                            entity_type=param["entity_type"]
+            # Update training phrases
+            intent.training_phrases.clear()
+            intent.training_phrases.extend([
+                Intent.TrainingPhrase(
+                    parts=[
+                        Intent.TrainingPhrase.Part(
+                            text=part["text"],
+                            parameter_id=part.get("parameter_id")
                         )
-                        for param in parameters
-                    ])
+                        for part in phrase
+                    ],
+                    repeat_count=1
+                )
+                for phrase in training_phrases
+            ])
+
+            # Update parameters if provided
+            if parameters:
+                intent.parameters.clear()
+                intent.parameters.extend([
+                    Intent.Parameter(
+                        id=param["id"],
+                        entity_type=param["entity_type"]
+                    )
+                    for param in parameters
+                ])
 
-                updated = self.intents_client.update_intent(intent=intent)
-                logger.info(f"  ✓ Updated intent with {len(training_phrases)} training phrases")
-                self._intents_cache[display_name] = updated
-                return updated
+            updated = self.intents_client.update_intent(intent=intent)
+            logger.info(f"  ✓ Updated intent with {len(training_phrases)} training phrases")
+            self._intents_cache[display_name] = updated
+            return updated
 
         # Create new
         logger.info(f"  Creating new intent: {display_name}")
@@ -12,6 +12,6 @@ __author__ = "Lee Whieldon"
 from . import agent
 
 # Make PawConnectMainAgent available at package level if needed
-from .agent import PawConnectMainAgent
+from .agent import PawConnectMainAgent, get_agent
 
-__all__ = ["agent", "PawConnectMainAgent"]
+__all__ = ["agent", "PawConnectMainAgent", "get_agent"]
@@ -4,16 +4,40 @@ Coordinates all sub-agents and manages the overall pet matching workflow.
 """
 
 import asyncio
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
+import orjson
 from loguru import logger
+from pydantic import TypeAdapter
 
 from .config import settings
-from .tools import PawConnectTools
+from .tools import get_tools
 from .sub_agents.conversation_agent import ConversationAgent
 from .schemas.user_profile import UserProfile
-from .schemas.pet_data import PetMatch
-from .utils.validators import validate_user_input
+from .schemas.pet_data import Pet, PetMatch
+from .sub_agents.pet_search_agent import STALE_NOTICE
+from .utils.cache import TTLCache
+from .utils.api_clients import ORJSON_OPTIONS
+from .utils.validators import CITY_STATE_PATTERN, validate_user_input
+
+# Serializes recommendation lists in one call instead of one per match
+PET_MATCH_LIST_ADAPTER = TypeAdapter(List[PetMatch])
+
+# Default visit slot offset from now, and how visit times are shown to users
+VISIT_LEAD_TIME = timedelta(days=1, hours=14)
+VISIT_TIME_FORMAT = "%A, %B %d at %I:%M %p"
+
+
+def _with_stale_notice(payload: Dict[str, Any], stale: bool) -> Dict[str, Any]:
+    """Flag a response built from last-good shelter results so users know it may be out of date."""
+    if stale:
+        payload["stale"] = True
+        payload["stale_notice"] = STALE_NOTICE
+    return payload
 
 # Import ADK for web interface support
 try:
@@ -35,9 +59,59 @@ class PawConnectMainAgent:
     def __init__(self):
         """Initialize the main agent and all sub-systems."""
         logger.info("Initializing PawConnect Main Agent")
-        self.tools = PawConnectTools()
+        self.tools = get_tools()
         self.conversation_agent = ConversationAgent()
-        self.user_sessions = {}  # Store user session data
+        # Store user session data, dropping idle and least recently used sessions
+        self.user_sessions = TTLCache(maxsize=settings.max_sessions, ttl=settings.session_ttl)
+        # Sessions with requests in flight, kept out of reach of eviction until they finish
+        self._active_sessions: Dict[str, Dict[str, Any]] = {}
+        # find_matches results per (profile, top_k), kept only as long as shelter searches are cached
+        self._match_cache = TTLCache(
+            maxsize=settings.shelter_cache_max_entries,
+            ttl=settings.shelter_cache_ttl
+        )
+        # Runs synchronous tools off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=settings.tool_workers)
+        # Runs blocking Gemini NLU calls off the event loop
+        self._nlu_executor = ThreadPoolExecutor(max_workers=settings.nlu_workers)
+        self.closed = False
+
+        # Intent handlers, called as handler(user_id, entities, session)
+        self._intent_handlers = {
+            "search_pets": self._handle_search_pets,
+            "get_recommendations": self._handle_get_recommendations,
+            "schedule_visit": self._handle_schedule_visit,
+            "submit_application": self._handle_submit_application,
+        }
+
+    async def __aenter__(self) -> "PawConnectMainAgent":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Shut down the worker threads owned by this agent.
+
+        The agent cannot process requests once closed. The tools instance is
+        shared process-wide, so its HTTP sessions are left open for other
+        agents; close them with get_tools().close() before the event loop
+        shuts down. They are reopened lazily on the next request.
+        """
+        self.closed = True
+        self._executor.shutdown(wait=False)
+        self._nlu_executor.shutdown(wait=False)
+
+    def _check_open(self) -> None:
+        """Fail fast instead of submitting work to shut-down worker pools."""
+        if self.closed:
+            raise RuntimeError("PawConnectMainAgent is closed")
+
+    async def _run_sync_tool(self, func, *args, **kwargs) -> Any:
+        """Run a synchronous tool in the worker pool so it doesn't block the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
 
     async def process_user_request(
         self,
@@ -55,58 +129,106 @@ class PawConnectMainAgent:
 
         Returns:
             Dictionary with response and any relevant data
+
+        Raises:
+            RuntimeError: If the agent has been closed
         """
-        try:
-            logger.info(f"Processing request from user {user_id}: {message}")
+        self._check_open()
 
-            # Get or create session
-            if user_id not in self.user_sessions:
-                self.user_sessions[user_id] = {
-                    "created_at": datetime.utcnow(),
+        try:
+            logger.info("Processing request from user {}: {}", user_id, message)
+
+            # Get or create session, refreshing its idle timeout
+            session = self._active_sessions.get(user_id)
+            if session is None:
+                session = self.user_sessions.get(user_id)
+            if session is None:
+                # Release idle sessions before adding a new one
+                self.user_sessions.expire()
+                session = {
+                    "created_at": time.time(),
                     "profile": user_profile,
-                    "context": {}
+                    "context": {},
+                    # Serializes concurrent requests from the same user
+                    "lock": asyncio.Lock(),
+                    # Requests holding or waiting on the lock
+                    "pending": 0
                 }
+            self.user_sessions[user_id] = session
 
-            session = self.user_sessions[user_id]
-
-            # Process message through conversation agent
-            conv_result = self.conversation_agent.process_user_input(
-                user_id=user_id,
-                message=message,
-                context=session["context"]
-            )
-
-            intent = conv_result["intent"]
-            entities = conv_result["entities"]
-
-            # Route to appropriate handler based on intent
-            if intent == "search_pets":
-                result = await self._handle_search_pets(user_id, entities, session)
-            elif intent == "get_recommendations":
-                result = await self._handle_get_recommendations(user_id, session)
-            elif intent == "schedule_visit":
-                result = await self._handle_schedule_visit(user_id, entities, session)
-            elif intent == "submit_application":
-                result = await self._handle_submit_application(user_id, entities, session)
-            else:
-                result = {
-                    "response": conv_result["response"],
-                    "intent": intent
+            # Turn away bursts from one user instead of letting them queue without bound
+            if session["pending"] >= settings.max_pending_requests_per_user:
+                logger.warning("Too many pending requests for user {}", user_id)
+                return {
+                    "response": "I'm still working on your previous requests. Please wait a moment and try again.",
+                    "error": "too_many_requests"
                 }
 
-            # Update session context
-            session["context"]["last_intent"] = intent
-            session["context"]["last_entities"] = entities
+            session["pending"] += 1
+            # Later requests must find this session, and its lock, even if the LRU evicts it meanwhile
+            self._active_sessions[user_id] = session
+            try:
+                async with session["lock"]:
+                    result = await self._dispatch(user_id, message, session)
+            finally:
+                session["pending"] -= 1
+                if session["pending"] == 0 and self._active_sessions.get(user_id) is session:
+                    del self._active_sessions[user_id]
+                    # Store it again in case it was evicted while in flight, keeping this request's updates
+                    self.user_sessions[user_id] = session
 
             return result
 
         except Exception as e:
-            logger.error(f"Error processing user request: {e}")
+            logger.error("Error processing user request: {}", e)
             return {
                 "response": "I'm sorry, I encountered an error processing your request. Please try again.",
                 "error": str(e)
             }
 
+    async def _dispatch(
+        self,
+        user_id: str,
+        message: str,
+        session: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run NLU on a message and route it to its intent handler."""
+        context = session["context"]
+        conversation_agent = self.conversation_agent
+
+        # Process message through conversation agent
+        process_input = partial(
+            conversation_agent.process_user_input,
+            user_id=user_id,
+            message=message,
+            context=context
+        )
+        if conversation_agent.use_gemini and conversation_agent.gemini_model:
+            # Gemini calls block on the network, so keep them off the event loop
+            loop = asyncio.get_running_loop()
+            conv_result = await loop.run_in_executor(self._nlu_executor, process_input)
+        else:
+            conv_result = process_input()
+
+        intent = conv_result["intent"]
+        entities = conv_result["entities"]
+
+        # Route to appropriate handler based on intent
+        handler = self._intent_handlers.get(intent)
+        if handler:
+            result = await handler(user_id, entities, session)
+        else:
+            result = {
+                "response": conv_result["response"],
+                "intent": intent
+            }
+
+        # Update session context
+        context["last_intent"] = intent
+        context["last_entities"] = entities
+
+        return result
+
     async def _handle_search_pets(
         self,
         user_id: str,
@@ -117,7 +239,8 @@ class PawConnectMainAgent:
         try:
             # Extract search parameters
             pet_type = entities.get("pet_type")
-            location = session.get("profile", {}).get("city") if session.get("profile") else None
+            user_profile = session.get("profile")
+            location = user_profile.city if user_profile else None
 
             if not location:
                 return {
@@ -127,28 +250,34 @@ class PawConnectMainAgent:
                 }
 
             # Search for pets
-            pets = await self.tools.fetch_shelter_data(
+            search_params = dict(
                 pet_type=pet_type,
                 location=location,
                 distance=50,
                 limit=50
             )
+            pets = await self.tools.fetch_shelter_data(**search_params)
+            stale = self.tools.search_agent.is_stale(**search_params)
+
+            # Keep the parsed pets on the session; they are only serialized for the client
+            session["search_results"] = pets
 
-            # Store in session context
-            session["context"]["search_results"] = [pet.dict() for pet in pets]
+            if pets and user_profile:
+                # Searches are usually followed by a recommendation request, so start scoring now
+                self._start_recommendations(session, user_profile, pets)
 
             response = f"I found {len(pets)} {pet_type or 'pet'}s near {location}. "
             if pets:
                 response += "Would you like me to recommend the best matches for you?"
 
-            return {
+            return _with_stale_notice({
                 "response": response,
                 "pets_found": len(pets),
                 "intent": "search_pets"
-            }
+            }, stale)
 
         except Exception as e:
-            logger.error(f"Error handling search pets: {e}")
+            logger.error("Error handling search pets: {}", e)
             return {
                 "response": "I had trouble searching for pets. Please try again.",
                 "error": str(e),
@@ -158,6 +287,7 @@ class PawConnectMainAgent:
     async def _handle_get_recommendations(
         self,
         user_id: str,
+        entities: Dict[str, Any],
         session: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Handle recommendation request."""
@@ -172,9 +302,9 @@ class PawConnectMainAgent:
                 }
 
             # Get search results from session or search
-            search_results = session["context"].get("search_results")
+            pets = session.get("search_results")
 
-            if not search_results:
+            if not pets:
                 # Search for pets
                 pets = await self.tools.fetch_shelter_data(
                     pet_type=user_profile.preferences.pet_type.value if user_profile.preferences.pet_type else None,
@@ -182,10 +312,6 @@ class PawConnectMainAgent:
                     distance=50,
                     limit=100
                 )
-            else:
-                # Convert dict back to Pet objects
-                from .schemas.pet_data import Pet
-                pets = [Pet(**pet_data) for pet_data in search_results]
 
             if not pets:
                 return {
@@ -194,41 +320,92 @@ class PawConnectMainAgent:
                     "intent": "get_recommendations"
                 }
 
-            # Generate recommendations
-            recommendations = self.tools.generate_recommendations(
-                user=user_profile,
-                pets=pets,
-                top_k=5
+            # Reuse the last (or prefetched) scoring run if neither the profile nor the pets changed
+            # Shielded so cancelling this request leaves the shared run for later requests
+            recommendations = await asyncio.shield(
+                self._start_recommendations(session, user_profile, pets)
             )
-
-            # Store in session
-            session["context"]["recommendations"] = [rec.dict() for rec in recommendations]
+            session["recommendations"] = recommendations
 
             # Build response
             if recommendations:
-                response = f"I found {len(recommendations)} great matches for you! Here are my top recommendations:\n\n"
-                for i, rec in enumerate(recommendations[:3], 1):
-                    pet = rec.pet
-                    response += f"{i}. {pet.name} - {pet.breed or pet.species.value.title()}"
-                    response += f" ({rec.overall_score:.0%} match)\n"
-                    response += f"   {rec.match_explanation}\n\n"
+                parts = [f"I found {len(recommendations)} great matches for you! Here are my top recommendations:\n\n"]
+                parts.extend(
+                    f"{i}. {rec.pet.name} - {rec.pet.breed or rec.pet.species.value.title()}"
+                    f" ({rec.overall_score:.0%} match)\n"
+                    f"   {rec.match_explanation}\n\n"
+                    for i, rec in enumerate(recommendations[:3], 1)
+                )
+                response = "".join(parts)
             else:
                 response = "I couldn't find any pets that match your criteria well. Would you like to adjust your preferences?"
 
             return {
                 "response": response,
-                "recommendations": [rec.dict() for rec in recommendations[:5]],
+                "recommendations": PET_MATCH_LIST_ADAPTER.dump_python(recommendations[:5]),
                 "intent": "get_recommendations"
             }
 
         except Exception as e:
-            logger.error(f"Error handling recommendations: {e}")
+            logger.error("Error handling recommendations: {}", e)
             return {
                 "response": "I had trouble generating recommendations. Please try again.",
                 "error": str(e),
                 "intent": "get_recommendations"
             }
 
+    def _start_recommendations(
+        self,
+        session: Dict[str, Any],
+        user_profile: UserProfile,
+        pets: List[Pet]
+    ) -> "asyncio.Future[List[PetMatch]]":
+        """
+        Get the scoring task for a profile and pet list, starting it if needed.
+
+        The task is kept on the session keyed by the profile and pet ids, so a
+        repeated or prefetched request awaits the existing run instead of
+        rescoring. A run that failed or was cancelled is started again.
+
+        Args:
+            session: User session
+            user_profile: User profile to score against
+            pets: Candidate pets
+
+        Returns:
+            Future resolving to the top recommendations
+        """
+        recommendation_key = (
+            user_profile.model_dump_json(),
+            tuple(pet.pet_id for pet in pets)
+        )
+
+        task = session.get("recommendations_task")
+        if (
+            task is None
+            or session.get("recommendation_key") != recommendation_key
+            or (task.done() and (task.cancelled() or task.exception() is not None))
+        ):
+            task = asyncio.ensure_future(
+                self._run_sync_tool(
+                    self.tools.generate_recommendations,
+                    user=user_profile,
+                    pets=pets,
+                    top_k=5
+                )
+            )
+            task.add_done_callback(self._log_recommendations_failure)
+            session["recommendation_key"] = recommendation_key
+            session["recommendations_task"] = task
+
+        return task
+
+    @staticmethod
+    def _log_recommendations_failure(task: "asyncio.Future[List[PetMatch]]") -> None:
+        """Log a failed scoring run, so an unawaited prefetch doesn't fail silently."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Recommendation scoring failed: {}", task.exception())
+
     async def _handle_schedule_visit(
         self,
         user_id: str,
@@ -237,8 +414,8 @@ class PawConnectMainAgent:
     ) -> Dict[str, Any]:
         """Handle visit scheduling intent."""
         try:
-            # Get pet from context or entities
-            recommendations = session["context"].get("recommendations", [])
+            # Get pet from session recommendations
+            recommendations = session.get("recommendations", [])
 
             if not recommendations:
                 return {
@@ -248,25 +425,26 @@ class PawConnectMainAgent:
                 }
 
             # For simplicity, schedule visit for first recommended pet
-            pet_data = recommendations[0]["pet"]
-            pet_id = pet_data["pet_id"]
+            pet = recommendations[0].pet
+            pet_id = pet.pet_id
 
             # Schedule for tomorrow at 2 PM (simplified)
-            from datetime import timedelta
-            visit_time = datetime.utcnow() + timedelta(days=1, hours=14)
+            visit_time = datetime.utcnow() + VISIT_LEAD_TIME
 
-            visit_info = self.tools.schedule_visit(
+            visit_info = await self.tools.schedule_visit(
                 user_id=user_id,
                 pet_id=pet_id,
                 preferred_time=visit_time
             )
 
-            pet_name = pet_data["name"]
-            shelter_name = pet_data["shelter"]["name"]
+            pet_name = pet.name
+            shelter_name = pet.shelter.name
 
-            response = f"Great! I've scheduled a visit for you to meet {pet_name} at {shelter_name} "
-            response += f"on {visit_time.strftime('%A, %B %d at %I:%M %p')}. "
-            response += "You'll receive a confirmation email shortly."
+            response = (
+                f"Great! I've scheduled a visit for you to meet {pet_name} at {shelter_name} "
+                f"on {visit_time.strftime(VISIT_TIME_FORMAT)}. "
+                "You'll receive a confirmation email shortly."
+            )
 
             return {
                 "response": response,
@@ -275,7 +453,7 @@ class PawConnectMainAgent:
             }
 
         except Exception as e:
-            logger.error(f"Error handling schedule visit: {e}")
+            logger.error("Error handling schedule visit: {}", e)
             return {
                 "response": "I had trouble scheduling your visit. Please try again.",
                 "error": str(e),
@@ -299,8 +477,8 @@ class PawConnectMainAgent:
                     "intent": "submit_application"
                 }
 
-            # Get pet from context
-            recommendations = session["context"].get("recommendations", [])
+            # Get pet from session recommendations
+            recommendations = session.get("recommendations", [])
 
             if not recommendations:
                 return {
@@ -309,8 +487,8 @@ class PawConnectMainAgent:
                     "intent": "submit_application"
                 }
 
-            pet_data = recommendations[0]["pet"]
-            pet_id = pet_data["pet_id"]
+            pet = recommendations[0].pet
+            pet_id = pet.pet_id
 
             # Build application data from user profile
             application_data = {
@@ -328,18 +506,21 @@ class PawConnectMainAgent:
             }
 
             # Process application
-            application = self.tools.process_application(
+            application = await self._run_sync_tool(
+                self.tools.process_application,
                 user_id=user_id,
                 pet_id=pet_id,
                 application_data=application_data,
                 application_type="adoption"
             )
 
-            pet_name = pet_data["name"]
+            pet_name = pet.name
 
-            response = f"Your adoption application for {pet_name} has been submitted successfully! "
-            response += f"Application ID: {application['application_id']}. "
-            response += "The shelter will review your application and contact you within 2-3 business days."
+            response = (
+                f"Your adoption application for {pet_name} has been submitted successfully! "
+                f"Application ID: {application['application_id']}. "
+                "The shelter will review your application and contact you within 2-3 business days."
+            )
 
             return {
                 "response": response,
@@ -348,7 +529,7 @@ class PawConnectMainAgent:
             }
 
         except Exception as e:
-            logger.error(f"Error handling application submission: {e}")
+            logger.error("Error handling application submission: {}", e)
             return {
                 "response": "I had trouble submitting your application. Please try again.",
                 "error": str(e),
@@ -371,10 +552,10 @@ class PawConnectMainAgent:
         is_valid, error_msg, user_profile = validate_user_input(user_data)
 
         if not is_valid:
-            logger.warning(f"Invalid user data: {error_msg}")
+            logger.warning("Invalid user data: {}", error_msg)
             raise ValueError(f"Invalid user data: {error_msg}")
 
-        logger.info(f"Created user profile for {user_profile.user_id}")
+        logger.info("Created user profile for {}", user_profile.user_id)
         return user_profile
 
     async def find_matches(
@@ -391,31 +572,63 @@ class PawConnectMainAgent:
 
         Returns:
             List of PetMatch objects
+
+        Raises:
+            RuntimeError: If the agent has been closed
         """
+        self._check_open()
+
         try:
-            logger.info(f"Finding matches for user {user_profile.user_id}")
+            logger.info("Finding matches for user {}", user_profile.user_id)
+
+            cache_key = (
+                top_k,
+                user_profile.model_dump_json(exclude={"created_at", "updated_at"})
+            )
+            matches = self._match_cache.get(cache_key)
+            if matches is not None:
+                logger.debug("Match cache hit for user {}", user_profile.user_id)
+                return list(matches)
 
             matches = await self.tools.search_and_recommend(
                 user=user_profile,
                 top_k=top_k
             )
 
-            logger.info(f"Found {len(matches)} matches")
-            return matches
+            # Empty results usually mean a failed search, so retry those next time
+            if matches:
+                self._match_cache[cache_key] = matches
+
+            logger.info("Found {} matches", len(matches))
+            return list(matches)
 
         except Exception as e:
-            logger.error(f"Error finding matches: {e}")
+            logger.error("Error finding matches: {}", e)
             return []
 
     def get_session(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user session data."""
-        return self.user_sessions.get(user_id)
+        session = self._active_sessions.get(user_id)
+        return session if session is not None else self.user_sessions.get(user_id)
 
     def clear_session(self, user_id: str) -> None:
         """Clear user session data."""
+        self._active_sessions.pop(user_id, None)
         if user_id in self.user_sessions:
             del self.user_sessions[user_id]
-            logger.info(f"Cleared session for user {user_id}")
+            logger.info("Cleared session for user {}", user_id)
+
+
+# Global agent instance, shared so sessions and worker pools persist across requests
+_agent: Optional[PawConnectMainAgent] = None
+
+
+def get_agent() -> PawConnectMainAgent:
+    """Get or create global main agent instance."""
+    global _agent
+    if _agent is None or _agent.closed:
+        _agent = PawConnectMainAgent()
+    return _agent
 
 
 # Main entry point for command-line usage
@@ -438,11 +651,10 @@ async def main():
     from .schemas.user_profile import UserProfile, UserPreferences, HomeType, ExperienceLevel, PetType, PetSize
 
     # Handle both "City, State" and "ZipCode" formats
-    if "," in args.user_location:
+    city_state = CITY_STATE_PATTERN.match(args.user_location)
+    if city_state:
         # City, State format
-        city, state = args.user_location.split(",")
-        city = city.strip()
-        state = state.strip()
+        city, state = city_state.groups()
         zip_code = "00000"
     else:
         # Zip code format - use placeholder values that pass validation
@@ -486,9 +698,14 @@ async def main():
             print()
 
     except Exception as e:
-        logger.error(f"Error in main: {e}")
+        logger.error("Error in main: {}", e)
         print(f"Error: {e}")
 
+    finally:
+        await agent.close()
+        # The CLI owns the process, so release the shared HTTP sessions too
+        await agent.tools.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -501,8 +718,19 @@ if __name__ == "__main__":
 if ADK_AVAILABLE:
     from google.adk.models import Gemini
     import os
-    from typing import Dict, List
-    from datetime import datetime, timedelta
+
+    _PET_NAME_PUNCTUATION = re.compile(r"[^\w\s]")
+
+    def _normalize_pet_name(name: str) -> str:
+        """Normalize a pet name for lookups so "Bella!" and " bella" both match "Bella"."""
+        return " ".join(_PET_NAME_PUNCTUATION.sub("", name).lower().split())
+
+    def _index_pets_by_name(pets) -> dict:
+        """Map normalized names to Pets; the first pet with a given name wins."""
+        by_name = {}
+        for pet in pets:
+            by_name.setdefault(_normalize_pet_name(pet.name), pet)
+        return by_name
 
     # ============================================================================
     # Conversation State Management - Store recent search results for follow-ups
@@ -512,44 +740,47 @@ if ADK_AVAILABLE:
 
         def __init__(self, ttl_minutes: int = 30):
             self._searches: Dict[str, dict] = {}  # session_id -> {timestamp, pets}
-            self._ttl = timedelta(minutes=ttl_minutes)
+            self._ttl = ttl_minutes * 60
 
         def store_search_results(self, session_id: str, pets: List[dict]):
             """Store search results for a session."""
             self._searches[session_id] = {
-                'timestamp': datetime.utcnow(),
-                'pets': pets
+                'timestamp': time.monotonic(),
+                'pets': pets,
+                # Name index for follow-up lookups; reversed so the first match wins
+                'by_name': {_normalize_pet_name(pet['name']): pet for pet in reversed(pets)}
             }
-            logger.info(f"Stored {len(pets)} pets for session {session_id}")
+            logger.info("Stored {} pets for session {}", len(pets), session_id)
 
-        def get_search_results(self, session_id: str) -> List[dict]:
-            """Get recent search results for a session."""
-            if session_id not in self._searches:
-                return []
+        def _get_search(self, session_id: str) -> Optional[dict]:
+            """Get a session's stored search if it is still fresh."""
+            search = self._searches.get(session_id)
+            if search is None:
+                return None
 
-            search = self._searches[session_id]
             # Check if results are still fresh
-            if datetime.utcnow() - search['timestamp'] > self._ttl:
+            if time.monotonic() - search['timestamp'] > self._ttl:
                 del self._searches[session_id]
-                return []
+                return None
+
+            return search
 
-            return search['pets']
+        def get_search_results(self, session_id: str) -> List[dict]:
+            """Get recent search results for a session."""
+            search = self._get_search(session_id)
+            return search['pets'] if search else []
 
         def find_pet_by_name(self, session_id: str, pet_name: str) -> dict:
             """Find a specific pet from recent searches by name."""
-            pets = self.get_search_results(session_id)
-            pet_name_lower = pet_name.lower()
-
-            for pet in pets:
-                if pet['name'].lower() == pet_name_lower:
-                    logger.info(f"Found pet {pet_name} in cached results")
-                    return pet
-
-            return None
+            search = self._get_search(session_id)
+            pet = search['by_name'].get(_normalize_pet_name(pet_name)) if search else None
+            if pet:
+                logger.info("Found pet {} in cached results", pet_name)
+            return pet
 
         def cleanup_old_sessions(self):
             """Remove expired sessions."""
-            now = datetime.utcnow()
+            now = time.monotonic()
             expired = [
                 sid for sid, data in self._searches.items()
                 if now - data['timestamp'] > self._ttl
@@ -588,6 +819,7 @@ When a user asks follow-up questions about a specific pet (e.g., "Tell me more a
 4. Only call get_rescue_contact if:
    - You DON'T have information about that pet from recent searches, OR
    - The user explicitly asks for contact information or scheduling
+   If the user asks about several pets at once, call get_rescue_contacts with all their names in one call instead of calling get_rescue_contact for each pet
 5. Only call search_pets again if the user is asking for a **NEW search with DIFFERENT criteria**:
    - Different pet type (dogs → cats)
    - Different size (any dogs → small dogs)
@@ -747,6 +979,55 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
     # Also set VERTEXAI environment variable to force Vertex AI usage
     os.environ["VERTEXAI"] = "1"
 
+    def _dumps(obj: Any) -> str:
+        """Serialize a tool result as compact JSON for Gemini."""
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def _truncate(text: str, limit: int = 200) -> str:
+        """Shorten text to limit characters, marking the cut with an ellipsis."""
+        return text if len(text) <= limit else text[:limit] + "..."
+
+    def _pet_to_tool_dict(pet) -> dict:
+        """Convert a Pet into the compact dict returned to Gemini by search_pets."""
+        shelter = pet.shelter
+        shelter_website = str(shelter.website) if shelter.website else None
+
+        # Construct adoption URL with priority order:
+        # 1. Direct animal URL from API (if available)
+        # 2. Shelter's website URL (if available)
+        # 3. None (direct user to contact information)
+        adoption_url = pet.animal_url or shelter_website
+
+        # Build full description including special needs if available
+        full_description = _truncate(pet.description)
+        if pet.special_needs_info:
+            full_description += f"\n\n⚠️ SPECIAL NEEDS: {pet.special_needs_info}"
+        if pet.has_allergies:
+            full_description += "\n\n⚠️ Has allergies - please inquire with shelter for details."
+
+        return {
+            "id": pet.pet_id,
+            "name": pet.name,
+            "breed": pet.breed or "Mixed Breed",
+            "age": pet.age.value,
+            "size": pet.size.value,
+            "sex": pet.gender.value,
+            "description": full_description,
+            "location": f"{shelter.city}, {shelter.state}",
+            "shelter_contact": {
+                "name": shelter.name,
+                "address": shelter.address,
+                "city": shelter.city,
+                "state": shelter.state,
+                "zip_code": shelter.zip_code,
+                "phone": shelter.phone,
+                "email": shelter.email,
+                "website": shelter_website
+            },
+            "photo_link": str(pet.primary_photo_url) if pet.primary_photo_url else None,
+            "adoption_url": adoption_url
+        }
+
     # Create function tools for RescueGroups API access
     async def search_pets(
         pet_type: str = "",
@@ -796,12 +1077,18 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
             - User: "Show me puppies" → search_pets(pet_type="dog", age="baby", location="[user's location]")
             - User: "Large Golden Retrievers" → search_pets(pet_type="dog", breed="Golden Retriever", size="large", location="[user's location]")
         """
-        import json
-        from .sub_agents.pet_search_agent import PetSearchAgent
+
+        # An unfiltered search returns arbitrary pets, so ask for criteria instead of calling the API
+        if not any((pet_type, location, breed, size, age)):
+            return _dumps({
+                "success": False,
+                "message": "Please specify at least a pet type or location to search.",
+                "pets": []
+            })
 
         try:
-            # Create search agent
-            search_agent = PetSearchAgent()
+            # Use the shared search agent so its result cache is reused
+            search_agent = get_tools().search_agent
 
             # Build kwargs for additional filters
             kwargs = {}
@@ -813,17 +1100,19 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
                 kwargs['age'] = age
 
             # Run async search (we're already in async context from ADK)
-            pets = await search_agent.search_pets(
+            search_params = dict(
                 pet_type=pet_type,
                 location=location,
                 distance=distance,
                 limit=min(limit, 100),
                 **kwargs
             )
+            pets = await search_agent.search_pets(**search_params)
+            stale = search_agent.is_stale(**search_params)
 
             # Format results for Gemini
             if not pets:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "message": f"No {pet_type}s found in {location or 'the database'}",
                     "pets": []
@@ -833,81 +1122,76 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
             results = []
             for pet in pets[:limit]:
                 try:
-                    # Construct adoption URL with priority order:
-                    # 1. Direct animal URL from API (if available)
-                    # 2. Shelter's website URL (if available)
-                    # 3. None (direct user to contact information)
-                    adoption_url = None
-
-                    # Priority 1: Check if API provided direct animal URL
-                    if hasattr(pet, 'animal_url') and pet.animal_url:
-                        adoption_url = str(pet.animal_url)
-                        logger.debug(f"Using animal_url for {pet.name}: {adoption_url}")
-                    # Priority 2: Use shelter's website
-                    elif pet.shelter and hasattr(pet.shelter, 'website') and pet.shelter.website:
-                        adoption_url = str(pet.shelter.website)
-                        logger.debug(f"Using shelter website for {pet.name}: {adoption_url}")
-                    else:
-                        logger.debug(f"No adoption URL available for {pet.name}, animal_url: {getattr(pet, 'animal_url', 'N/A')}")
-
-                    # Build shelter contact information
-                    shelter_contact = {}
-                    if pet.shelter:
-                        shelter_contact = {
-                            "name": pet.shelter.name,
-                            "address": getattr(pet.shelter, 'address', None),
-                            "city": pet.shelter.city,
-                            "state": pet.shelter.state,
-                            "zip_code": pet.shelter.zip_code,
-                            "phone": getattr(pet.shelter, 'phone', None),
-                            "email": getattr(pet.shelter, 'email', None),
-                            "website": str(pet.shelter.website) if hasattr(pet.shelter, 'website') and pet.shelter.website else None
-                        }
-
-                    # Build full description including special needs if available
-                    full_description = pet.description[:200] + "..." if len(pet.description) > 200 else pet.description
-                    if hasattr(pet, 'special_needs_info') and pet.special_needs_info:
-                        full_description += f"\n\n⚠️ SPECIAL NEEDS: {pet.special_needs_info}"
-                    if hasattr(pet, 'has_allergies') and pet.has_allergies:
-                        full_description += "\n\n⚠️ Has allergies - please inquire with shelter for details."
-
-                    pet_dict = {
-                        "id": pet.pet_id,
-                        "name": pet.name,
-                        "breed": pet.breed or "Mixed Breed",
-                        "age": pet.age.value if hasattr(pet.age, 'value') else str(pet.age),
-                        "size": pet.size.value if hasattr(pet.size, 'value') else str(pet.size),
-                        "sex": pet.gender.value if hasattr(pet.gender, 'value') else str(pet.gender),
-                        "description": full_description,
-                        "location": f"{pet.shelter.city}, {pet.shelter.state}" if pet.shelter else "Location not specified",
-                        "shelter_name": pet.shelter.name if pet.shelter else "Unknown",
-                        "shelter_contact": shelter_contact,
-                        "photo_link": str(pet.primary_photo_url) if pet.primary_photo_url else None,
-                        "adoption_url": adoption_url
-                    }
-                    results.append(pet_dict)
+                    results.append(_pet_to_tool_dict(pet))
                 except Exception as e:
-                    logger.error(f"Error processing pet {pet.name}: {e}")
+                    logger.error("Error processing pet {}: {}", pet.name, e)
                     continue
 
+            # One summary line instead of a debug call per pet; only counted when debug is enabled
+            logger.opt(lazy=True).debug(
+                "{} of {} pets have no adoption URL",
+                lambda: sum(1 for result in results if not result["adoption_url"]),
+                lambda: len(results)
+            )
+
             # Store search results in conversation state for follow-up questions
             conversation_state.store_search_results(session_id, results)
 
-            return json.dumps({
+            return _dumps(_with_stale_notice({
                 "success": True,
                 "message": f"Found {len(results)} {pet_type}(s) in {location or 'the database'}",
                 "count": len(results),
                 "pets": results
-            }, indent=2)
+            }, stale))
 
         except Exception as e:
-            logger.error(f"Error in search_pets function: {e}")
-            return json.dumps({
+            logger.error("Error in search_pets function: {}", e)
+            return _dumps({
                 "success": False,
                 "message": f"Error searching for pets: {str(e)}",
                 "pets": []
             })
 
+    def _contact_from_cached_pet(cached_pet: dict) -> dict:
+        """Build rescue contact info from a pet dict stored by search_pets."""
+        shelter_contact = cached_pet.get('shelter_contact', {})
+        return {
+            "pet_name": cached_pet['name'],
+            "pet_breed": cached_pet.get('breed', 'Mixed Breed'),
+            "pet_age": cached_pet.get('age', 'Unknown'),
+            "pet_description": cached_pet.get('description', 'No description available'),
+            "photo_link": cached_pet.get('photo_link'),
+            "rescue_name": shelter_contact.get('name', 'Unknown'),
+            "phone": shelter_contact.get('phone'),
+            "email": shelter_contact.get('email'),
+            "website": shelter_contact.get('website'),
+            "address": shelter_contact.get('address'),
+            "city": shelter_contact.get('city'),
+            "state": shelter_contact.get('state'),
+            "zip_code": shelter_contact.get('zip_code'),
+            "full_address": f"{shelter_contact.get('address', '')}, {shelter_contact.get('city', '')}, {shelter_contact.get('state', '')} {shelter_contact.get('zip_code', '')}".strip(", ")
+        }
+
+    def _contact_from_pet(pet) -> dict:
+        """Build rescue contact info from a Pet returned by a search."""
+        shelter = pet.shelter
+        return {
+            "pet_name": pet.name,
+            "pet_breed": pet.breed or "Mixed Breed",
+            "pet_age": pet.age.value,
+            "pet_description": _truncate(pet.description),
+            "photo_link": str(pet.primary_photo_url) if pet.primary_photo_url else None,
+            "rescue_name": shelter.name,
+            "phone": shelter.phone,
+            "email": shelter.email,
+            "website": str(shelter.website) if shelter.website else None,
+            "address": shelter.address,
+            "city": shelter.city,
+            "state": shelter.state,
+            "zip_code": shelter.zip_code,
+            "full_address": f"{shelter.address}, {shelter.city}, {shelter.state} {shelter.zip_code}".strip(", ")
+        }
+
     async def get_rescue_contact(pet_name: str, location: str = "", session_id: str = "default") -> str:
         """
         Get contact information for the rescue organization caring for a specific pet.
@@ -921,91 +1205,117 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
         Returns:
             JSON string with rescue contact information
         """
-        import json
-        from .sub_agents.pet_search_agent import PetSearchAgent
 
         try:
-            logger.info(f"Getting rescue contact for pet: {pet_name}")
+            logger.info("Getting rescue contact for pet: {}", pet_name)
 
             # First, check if pet is in recent search results (avoid unnecessary API call)
             cached_pet = conversation_state.find_pet_by_name(session_id, pet_name)
 
             if cached_pet:
-                logger.info(f"Using cached data for {pet_name}")
+                logger.info("Using cached data for {}", pet_name)
                 # Pet found in cache - return contact info directly
-                contact_info = {
-                    "pet_name": cached_pet['name'],
-                    "pet_breed": cached_pet.get('breed', 'Mixed Breed'),
-                    "pet_age": cached_pet.get('age', 'Unknown'),
-                    "pet_description": cached_pet.get('description', 'No description available'),
-                    "photo_link": cached_pet.get('photo_link'),
-                    "rescue_name": cached_pet.get('shelter_contact', {}).get('name', 'Unknown'),
-                    "phone": cached_pet.get('shelter_contact', {}).get('phone'),
-                    "email": cached_pet.get('shelter_contact', {}).get('email'),
-                    "website": cached_pet.get('shelter_contact', {}).get('website'),
-                    "address": cached_pet.get('shelter_contact', {}).get('address'),
-                    "city": cached_pet.get('shelter_contact', {}).get('city'),
-                    "state": cached_pet.get('shelter_contact', {}).get('state'),
-                    "zip_code": cached_pet.get('shelter_contact', {}).get('zip_code'),
-                    "full_address": f"{cached_pet.get('shelter_contact', {}).get('address', '')}, {cached_pet.get('shelter_contact', {}).get('city', '')}, {cached_pet.get('shelter_contact', {}).get('state', '')} {cached_pet.get('shelter_contact', {}).get('zip_code', '')}".strip(", ")
-                }
+                shelter_contact = cached_pet.get('shelter_contact', {})
+                contact_info = _contact_from_cached_pet(cached_pet)
 
-                return json.dumps({
+                return _dumps({
                     "success": True,
-                    "message": f"Contact information for {cached_pet['name']} at {cached_pet.get('shelter_contact', {}).get('name', 'the rescue')}",
+                    "message": f"Contact information for {cached_pet['name']} at {shelter_contact.get('name', 'the rescue')}",
                     "contact": contact_info,
                     "from_cache": True
-                }, indent=2)
+                })
 
             # Pet not in cache - need to search
-            logger.info(f"Pet {pet_name} not in cache, performing search")
-            search_agent = PetSearchAgent()
+            logger.info("Pet {} not in cache, performing search", pet_name)
+            search_agent = get_tools().search_agent
             pets = await search_agent.search_pets(
                 location=location,
                 limit=20
             )
+            stale = search_agent.is_stale(location=location, limit=20)
 
-            # Find the pet by name (case insensitive)
-            pet = None
-            for p in pets:
-                if p.name.lower() == pet_name.lower():
-                    pet = p
-                    break
+            # Find the pet by name (case and punctuation insensitive)
+            pet = _index_pets_by_name(pets).get(_normalize_pet_name(pet_name))
 
             if not pet or not pet.shelter:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "message": f"Could not find contact information for a pet named {pet_name}. Please search for pets first.",
                 })
 
             # Extract complete contact information including photo
-            contact_info = {
-                "pet_name": pet.name,
-                "pet_breed": pet.breed or "Mixed Breed",
-                "pet_age": pet.age.value if hasattr(pet.age, 'value') else str(pet.age),
-                "pet_description": pet.description[:200] + "..." if len(pet.description) > 200 else pet.description,
-                "photo_link": str(pet.primary_photo_url) if pet.primary_photo_url else None,
-                "rescue_name": pet.shelter.name,
-                "phone": getattr(pet.shelter, 'phone', None),
-                "email": getattr(pet.shelter, 'email', None),
-                "website": str(pet.shelter.website) if hasattr(pet.shelter, 'website') and pet.shelter.website else None,
-                "address": getattr(pet.shelter, 'address', None),
-                "city": pet.shelter.city,
-                "state": pet.shelter.state,
-                "zip_code": pet.shelter.zip_code,
-                "full_address": f"{getattr(pet.shelter, 'address', '')}, {pet.shelter.city}, {pet.shelter.state} {pet.shelter.zip_code}".strip(", ")
-            }
+            contact_info = _contact_from_pet(pet)
 
-            return json.dumps({
+            return _dumps(_with_stale_notice({
                 "success": True,
                 "message": f"Contact information for {pet.name} at {pet.shelter.name}",
                 "contact": contact_info,
                 "from_cache": False
-            }, indent=2)
+            }, stale))
+
+        except Exception as e:
+            logger.error("Error getting rescue contact: {}", e)
+            return _dumps({
+                "success": False,
+                "message": f"Error retrieving contact information: {str(e)}"
+            })
+
+    async def get_rescue_contacts(pet_names: List[str], location: str = "", session_id: str = "default") -> str:
+        """
+        Get rescue contact information for several pets at once.
+        Use this instead of get_rescue_contact when the user asks about more than one pet.
+
+        Args:
+            pet_names: Names of the pets the user is interested in
+            location: Optional location to help narrow down the search
+            session_id: Session ID for retrieving cached pet data
+
+        Returns:
+            JSON string with contact information for each pet found
+        """
+
+        try:
+            logger.info("Getting rescue contacts for pets: {}", pet_names)
+
+            contacts = []
+            missing = []
+            for pet_name in pet_names:
+                cached_pet = conversation_state.find_pet_by_name(session_id, pet_name)
+                if cached_pet:
+                    contacts.append(_contact_from_cached_pet(cached_pet))
+                else:
+                    missing.append(pet_name)
+
+            not_found = []
+            stale = False
+            if missing:
+                # One search resolves every pet that wasn't in the recent results
+                logger.info("Pets {} not in cache, performing search", missing)
+                search_agent = get_tools().search_agent
+                pets = await search_agent.search_pets(
+                    location=location,
+                    limit=20
+                )
+                stale = search_agent.is_stale(location=location, limit=20)
+                by_name = _index_pets_by_name(pets)
+
+                for pet_name in missing:
+                    pet = by_name.get(_normalize_pet_name(pet_name))
+                    if pet and pet.shelter:
+                        contacts.append(_contact_from_pet(pet))
+                    else:
+                        not_found.append(pet_name)
+
+            return _dumps(_with_stale_notice({
+                "success": bool(contacts),
+                "message": f"Found contact information for {len(contacts)} of {len(pet_names)} pets",
+                "contacts": contacts,
+                "not_found": not_found
+            }, stale))
 
         except Exception as e:
-            logger.error(f"Error getting rescue contact: {e}")
-            return json.dumps({
+            logger.error("Error getting rescue contacts: {}", e)
+            return _dumps({
                 "success": False,
                 "message": f"Error retrieving contact information: {str(e)}"
             })
@@ -1031,29 +1341,27 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
         Returns:
             JSON string with visit scheduling confirmation
         """
-        import json
-        from .sub_agents.pet_search_agent import PetSearchAgent
-        from datetime import datetime, timedelta
 
         try:
-            logger.info(f"Scheduling visit for pet: {pet_name}")
+            logger.info("Scheduling visit for pet: {}", pet_name)
 
             # First, check if pet is in recent search results (avoid unnecessary API call)
             cached_pet = conversation_state.find_pet_by_name(session_id, pet_name)
 
             if cached_pet:
-                logger.info(f"Using cached data for {pet_name}")
+                logger.info("Using cached data for {}", pet_name)
                 # Pet found in cache - use cached data
+                shelter_contact = cached_pet.get('shelter_contact', {})
                 pet_id = cached_pet['id']
                 pet_breed = cached_pet.get('breed', 'Mixed Breed')
-                shelter_name = cached_pet.get('shelter_contact', {}).get('name', 'Unknown')
-                shelter_phone = cached_pet.get('shelter_contact', {}).get('phone')
-                shelter_email = cached_pet.get('shelter_contact', {}).get('email')
-                shelter_website = cached_pet.get('shelter_contact', {}).get('website')
-                shelter_address = cached_pet.get('shelter_contact', {}).get('address', '')
-                shelter_city = cached_pet.get('shelter_contact', {}).get('city', '')
-                shelter_state = cached_pet.get('shelter_contact', {}).get('state', '')
-                shelter_zip = cached_pet.get('shelter_contact', {}).get('zip_code', '')
+                shelter_name = shelter_contact.get('name', 'Unknown')
+                shelter_phone = shelter_contact.get('phone')
+                shelter_email = shelter_contact.get('email')
+                shelter_website = shelter_contact.get('website')
+                shelter_address = shelter_contact.get('address', '')
+                shelter_city = shelter_contact.get('city', '')
+                shelter_state = shelter_contact.get('state', '')
+                shelter_zip = shelter_contact.get('zip_code', '')
                 full_address = f"{shelter_address}, {shelter_city}, {shelter_state} {shelter_zip}".strip(", ")
 
                 # Parse preferred time
@@ -1067,17 +1375,17 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
                     visit_datetime = datetime.utcnow() + timedelta(days=1)
                     visit_datetime = visit_datetime.replace(hour=14, minute=0, second=0, microsecond=0)
 
-                # Create tools instance and schedule visit
-                tools = PawConnectTools()
+                # Schedule visit with the shared tools instance
+                tools = get_tools()
                 user_id = "web_user"
 
-                visit_info = tools.schedule_visit(
+                visit_info = await tools.schedule_visit(
                     user_id=user_id,
                     pet_id=pet_id,
                     preferred_time=visit_datetime
                 )
 
-                return json.dumps({
+                return _dumps({
                     "success": True,
                     "message": f"Visit request submitted for {pet_name}!",
                     "visit": {
@@ -1092,32 +1400,28 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
                         "rescue_website": shelter_website,
                         "rescue_address": full_address,
                         "next_steps": [
-                            f"The rescue will receive your visit request for {visit_datetime.strftime('%A, %B %d at %I:%M %p')}",
+                            f"The rescue will receive your visit request for {visit_datetime.strftime(VISIT_TIME_FORMAT)}",
                             "They will contact you to confirm the appointment or suggest alternative times",
                             "Please call or email them directly if you need to make changes",
                             "Bring a valid ID and any questions you have about the adoption process"
                         ]
                     },
                     "from_cache": True
-                }, indent=2)
+                })
 
             # Pet not in cache - need to search
-            logger.info(f"Pet {pet_name} not in cache, performing search")
-            search_agent = PetSearchAgent()
+            logger.info("Pet {} not in cache, performing search", pet_name)
+            search_agent = get_tools().search_agent
             pets = await search_agent.search_pets(
                 location=location,
                 limit=20
             )
 
-            # Find the pet by name (case insensitive)
-            pet = None
-            for p in pets:
-                if p.name.lower() == pet_name.lower():
-                    pet = p
-                    break
+            # Find the pet by name (case and punctuation insensitive)
+            pet = _index_pets_by_name(pets).get(_normalize_pet_name(pet_name))
 
             if not pet or not pet.shelter:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "message": f"Could not find a pet named {pet_name}. Please search for pets first.",
                 })
@@ -1136,18 +1440,19 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
                 visit_datetime = datetime.utcnow() + timedelta(days=1)
                 visit_datetime = visit_datetime.replace(hour=14, minute=0, second=0, microsecond=0)
 
-            # Create tools instance and schedule visit
-            tools = PawConnectTools()
+            # Schedule visit with the shared tools instance
+            tools = get_tools()
             user_id = "web_user"  # Default user ID for web interface
 
-            visit_info = tools.schedule_visit(
+            visit_info = await tools.schedule_visit(
                 user_id=user_id,
                 pet_id=pet.pet_id,
                 preferred_time=visit_datetime
             )
 
             # Build response with visit details and rescue contact info
-            return json.dumps({
+            shelter = pet.shelter
+            return _dumps({
                 "success": True,
                 "message": f"Visit request submitted for {pet.name}!",
                 "visit": {
@@ -1156,24 +1461,24 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
                     "pet_breed": pet.breed or "Mixed Breed",
                     "scheduled_time": visit_info["scheduled_time"],
                     "status": visit_info["status"],
-                    "rescue_name": pet.shelter.name,
-                    "rescue_phone": getattr(pet.shelter, 'phone', None),
-                    "rescue_email": getattr(pet.shelter, 'email', None),
-                    "rescue_website": str(pet.shelter.website) if hasattr(pet.shelter, 'website') and pet.shelter.website else None,
-                    "rescue_address": f"{getattr(pet.shelter, 'address', '')}, {pet.shelter.city}, {pet.shelter.state} {pet.shelter.zip_code}".strip(", "),
+                    "rescue_name": shelter.name,
+                    "rescue_phone": shelter.phone,
+                    "rescue_email": shelter.email,
+                    "rescue_website": str(shelter.website) if shelter.website else None,
+                    "rescue_address": f"{shelter.address}, {shelter.city}, {shelter.state} {shelter.zip_code}".strip(", "),
                     "next_steps": [
-                        f"The rescue will receive your visit request for {visit_datetime.strftime('%A, %B %d at %I:%M %p')}",
+                        f"The rescue will receive your visit request for {visit_datetime.strftime(VISIT_TIME_FORMAT)}",
                         "They will contact you to confirm the appointment or suggest alternative times",
                         "Please call or email them directly if you need to make changes",
                         "Bring a valid ID and any questions you have about the adoption process"
                     ]
                 },
                 "from_cache": False
-            }, indent=2)
+            })
 
         except Exception as e:
-            logger.error(f"Error scheduling visit: {e}")
-            return json.dumps({
+            logger.error("Error scheduling visit: {}", e)
+            return _dumps({
                 "success": False,
                 "message": f"Error scheduling visit: {str(e)}"
             })
@@ -1181,7 +1486,11 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
     # Create the ADK LlmAgent with Vertex AI configuration
     try:
         from google.genai import Client
-        from functools import cached_property
+
+        @lru_cache(maxsize=4)
+        def _make_genai_client(vertexai: bool, project: Optional[str], location: Optional[str]) -> Client:
+            """Create a genai Client once per configuration so credential discovery runs once."""
+            return Client(vertexai=vertexai, project=project, location=location)
 
         # Create a custom Gemini subclass that properly maintains Vertex AI config
         class VertexAIGemini(Gemini):
@@ -1193,12 +1502,8 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
                 self._vertexai = kwargs.get('vertexai', True)
                 self._project = kwargs.get('project')
                 self._location = kwargs.get('location')
-                # Pre-create the client
-                self._cached_client = Client(
-                    vertexai=self._vertexai,
-                    project=self._project,
-                    location=self._location
-                )
+                # Reuse the process-wide client for this configuration
+                self._cached_client = _make_genai_client(self._vertexai, self._project, self._location)
 
             @property
             def api_client(self):
@@ -1215,21 +1520,24 @@ Be friendly, empathetic, and guide users through the pet adoption journey with r
         )
 
         # Create the ADK LlmAgent with the configured Gemini LLM and tools
+        adk_tools = [search_pets, get_rescue_contact, get_rescue_contacts, schedule_visit]
         root_agent = LlmAgent(
             name="pawconnect_ai",
             model=gemini_llm,
             instruction=SYSTEM_INSTRUCTION,
-            tools=[search_pets, get_rescue_contact, schedule_visit]
+            tools=adk_tools
         )
 
-        logger.info(f"ADK root_agent created successfully with Vertex AI Gemini")
-        logger.info(f"Project: {settings.gcp_project_id}, Region: {settings.gcp_region}")
-        logger.info(f"Custom VertexAI Gemini class configured")
-        logger.info(f"Function tools registered: search_pets, get_rescue_contact, schedule_visit")
+        logger.info(
+            "ADK root_agent created with Vertex AI Gemini (project={}, region={}, tools={})",
+            settings.gcp_project_id,
+            settings.gcp_region,
+            [tool.__name__ for tool in adk_tools]
+        )
 
     except Exception as e:
-        logger.error(f"Failed to create ADK agent with Gemini LLM: {e}")
-        logger.warning(f"Error details: {type(e).__name__}: {str(e)}")
+        logger.error("Failed to create ADK agent with Gemini LLM: {}", e)
+        logger.warning("Error details: {}: {}", type(e).__name__, e)
 
         # If this fails, PawConnect won't work with ADK web interface
         # User will need to check their GCP credentials and configuration
@@ -1243,8 +1551,11 @@ else:
     # Create a dummy agent if ADK is not available
     class DummyAgent:
         """Dummy agent for when ADK is not available."""
+
+        UNAVAILABLE_MESSAGE = "ADK is not available. Please install google-adk package."
+
         async def send(self, message: str, user_id: str = "default") -> str:
-            return "ADK is not available. Please install google-adk package."
+            return self.UNAVAILABLE_MESSAGE
 
     root_agent = DummyAgent()
     logger.warning("ADK not available - created dummy root_agent")
@@ -109,10 +109,27 @@ class Settings(BaseSettings):
     api_timeout: int = Field(default=30, description="API request timeout in seconds")
     api_max_retries: int = Field(default=3, description="Maximum API retry attempts")
     api_rate_limit: int = Field(default=100, description="API rate limit per minute")
+    api_connection_limit: int = Field(default=50, description="Maximum pooled HTTP connections per API client")
+    tool_workers: int = Field(default=4, description="Worker threads for synchronous agent tools")
+    nlu_workers: int = Field(default=8, description="Worker threads for blocking Gemini NLU calls")
 
     # Search Settings
     default_search_radius: int = Field(default=50, description="Default search radius in miles")
     max_search_results: int = Field(default=100, description="Maximum search results")
+    shelter_cache_ttl: int = Field(default=300, description="Shelter search cache TTL in seconds")
+    shelter_cache_max_entries: int = Field(default=256, description="Maximum cached shelter searches")
+    shelter_stale_ttl: int = Field(
+        default=86400,
+        description="How long last-good shelter results may be served during API errors, in seconds"
+    )
+
+    # Session Settings
+    max_sessions: int = Field(default=1000, description="Maximum in-memory user sessions")
+    session_ttl: int = Field(default=1800, description="Idle user session TTL in seconds")
+    max_pending_requests_per_user: int = Field(
+        default=4,
+        description="Maximum queued requests per user before new ones are turned away"
+    )
 
     # Recommendation Settings
     recommendation_top_k: int = Field(default=10, description="Number of top recommendations")
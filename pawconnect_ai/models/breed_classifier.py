@@ -36,6 +36,10 @@ class BreedClassifier:
         "Russian Blue", "Norwegian Forest Cat", "Bengal", "Tonkinese"
     ]
 
+    # Lowercased breed names, computed once for label matching
+    _DOG_BREEDS_LOWER = [(breed.lower(), breed) for breed in DOG_BREEDS]
+    _CAT_BREEDS_LOWER = [(breed.lower(), breed) for breed in CAT_BREEDS]
+
     # Age indicators based on visual features
     AGE_INDICATORS = {
         "baby": ["puppy", "kitten", "young", "small", "playful"],
@@ -112,29 +116,29 @@ class BreedClassifier:
 
         # Determine which breed list to use
         if pet_type and pet_type.lower() == "dog":
-            breed_list = self.DOG_BREEDS
+            breed_list = self._DOG_BREEDS_LOWER
         elif pet_type and pet_type.lower() == "cat":
-            breed_list = self.CAT_BREEDS
+            breed_list = self._CAT_BREEDS_LOWER
         else:
             # Try to detect from labels
             has_dog = any("dog" in label["description"].lower() for label in labels)
             has_cat = any("cat" in label["description"].lower() for label in labels)
 
             if has_dog:
-                breed_list = self.DOG_BREEDS
+                breed_list = self._DOG_BREEDS_LOWER
             elif has_cat:
-                breed_list = self.CAT_BREEDS
+                breed_list = self._CAT_BREEDS_LOWER
             else:
                 return breeds
 
         # Match labels to known breeds
         for label in labels:
-            description = label["description"]
+            description = label["description"].lower()
             score = label["score"]
 
             # Check if label matches any known breed
-            for breed in breed_list:
-                if breed.lower() in description.lower() or description.lower() in breed.lower():
+            for breed_lower, breed in breed_list:
+                if breed_lower in description or description in breed_lower:
                     breeds.append({
                         "breed": breed,
                         "confidence": round(score, 3)
@@ -294,17 +298,17 @@ class BreedClassifier:
         Returns:
             Tuple of (breed_name, confidence)
         """
-        breed_list = self.DOG_BREEDS if pet_type == "dog" else self.CAT_BREEDS
+        breed_list = self._DOG_BREEDS_LOWER if pet_type == "dog" else self._CAT_BREEDS_LOWER
 
         best_match = None
         best_score = 0.0
 
         for label in image_labels:
-            description = label.get("description", "")
+            description = label.get("description", "").lower()
             score = label.get("score", 0.0)
 
-            for breed in breed_list:
-                if breed.lower() in description.lower():
+            for breed_lower, breed in breed_list:
+                if breed_lower in description:
                     if score > best_score:
                         best_match = breed
                         best_score = score
@@ -4,13 +4,32 @@ Uses a hybrid approach combining collaborative filtering and content-based recom
 """
 
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 
 from ..schemas.pet_data import Pet
 from ..schemas.user_profile import UserProfile
 from ..utils.helpers import calculate_urgency_score
 
+# Ordinal encodings shared by the per-pet and batched feature extraction
+SIZE_CODES = {"small": 0, "medium": 1, "large": 2, "extra_large": 3}
+AGE_CODES = {"baby": 0, "young": 1, "adult": 2, "senior": 3}
+ENERGY_CODES = {"low": 0, "moderate": 1, "high": 2}
+
+# Column names and dtypes of the encoded pet features used for batch scoring
+PET_FEATURE_COLUMNS = (
+    ("size", np.int8),
+    ("age", np.int8),
+    ("energy_level", np.int8),
+    ("good_with_children", np.float64),
+    ("good_with_dogs", np.float64),
+    ("good_with_cats", np.float64),
+    ("house_trained", bool),
+    ("special_needs", bool),
+    ("days_in_shelter", np.int64),
+    ("is_urgent", bool),
+)
+
 
 class RecommendationModel:
     """
@@ -93,27 +112,13 @@ class RecommendationModel:
         """
         features = {
             # Size encoding (0-3 scale)
-            "size": {
-                "small": 0,
-                "medium": 1,
-                "large": 2,
-                "extra_large": 3,
-            }.get(pet.size.value, 1),
+            "size": SIZE_CODES.get(pet.size.value, 1),
 
             # Age encoding (0-3 scale)
-            "age": {
-                "baby": 0,
-                "young": 1,
-                "adult": 2,
-                "senior": 3,
-            }.get(pet.age.value, 2),
+            "age": AGE_CODES.get(pet.age.value, 2),
 
             # Energy level (0-2 scale)
-            "energy_level": {
-                "low": 0,
-                "moderate": 1,
-                "high": 2,
-            }.get(pet.attributes.energy_level, 1),
+            "energy_level": ENERGY_CODES.get(pet.attributes.energy_level, 1),
 
             # Behavioral attributes
             "good_with_children": self._to_score(pet.attributes.good_with_children),
@@ -403,8 +408,201 @@ class RecommendationModel:
                 "urgency_boost": 0.0,
             }
 
+    def encode_pet_features(self, pet: Pet) -> Tuple:
+        """
+        Encode the pet attributes used for batch scoring.
+
+        Args:
+            pet: Pet profile
+
+        Returns:
+            Tuple of encoded features, in PET_FEATURE_COLUMNS order
+        """
+        attributes = pet.attributes
+        return (
+            SIZE_CODES.get(pet.size.value, 1),
+            AGE_CODES.get(pet.age.value, 2),
+            ENERGY_CODES.get(attributes.energy_level, 1),
+            self._to_score(attributes.good_with_children),
+            self._to_score(attributes.good_with_dogs),
+            self._to_score(attributes.good_with_cats),
+            bool(attributes.house_trained),
+            bool(attributes.special_needs),
+            pet.days_in_shelter or 0,
+            bool(pet.is_urgent),
+        )
+
+    def precompute_pet_features(self, pets: List[Pet]) -> None:
+        """
+        Encode scoring features for fetched pets that have not been encoded yet.
+
+        Pet attributes are treated as fixed once fetched, so later scoring
+        reuses the stored encoding.
+
+        Args:
+            pets: List of pet profiles
+        """
+        for pet in pets:
+            if pet._feature_row is None:
+                pet._feature_row = self.encode_pet_features(pet)
+
+    def extract_pet_feature_arrays(self, pets: List[Pet]) -> Dict[str, np.ndarray]:
+        """
+        Extract pet features for a batch of pets as column arrays.
+
+        Args:
+            pets: List of pet profiles
+
+        Returns:
+            Dictionary mapping feature name to an array with one entry per pet
+        """
+        rows = [pet._feature_row or self.encode_pet_features(pet) for pet in pets]
+        columns = zip(*rows) if rows else [()] * len(PET_FEATURE_COLUMNS)
+
+        features = {
+            name: np.array(values, dtype=dtype)
+            for (name, dtype), values in zip(PET_FEATURE_COLUMNS, columns)
+        }
+
+        # Same rules as helpers.calculate_urgency_score, applied to all pets
+        days = features["days_in_shelter"]
+        urgency = np.where(features["is_urgent"], 0.4, 0.0)
+        urgency = urgency + np.select([days > 180, days > 90, days > 30], [0.3, 0.2, 0.1], 0.0)
+        urgency = urgency + np.where(features["age"] == 3, 0.2, 0.0)
+        urgency = urgency + np.where(features["special_needs"], 0.1, 0.0)
+        features["urgency_score"] = np.minimum(urgency, 1.0)
+
+        return features
+
+    def score_pets(self, user: UserProfile, pets: List[Pet]) -> Dict[str, np.ndarray]:
+        """
+        Score every pet for a user in one vectorized pass.
+
+        Applies the same rules as calculate_lifestyle_score,
+        calculate_personality_score and calculate_practical_score, but
+        evaluates each rule across all pets at once with NumPy.
+
+        Args:
+            user: User profile
+            pets: List of pet profiles
+
+        Returns:
+            Dictionary of unrounded component and overall score arrays
+        """
+        u = self.extract_user_features(user)
+        p = self.extract_pet_feature_arrays(pets)
+        n = len(pets)
+
+        size = p["size"]
+        energy = p["energy_level"]
+        large = size >= 2
+
+        # Lifestyle compatibility
+        lifestyle = np.zeros(n)
+        lifestyle_weight = np.zeros(n)
+
+        if u["home_is_apartment"]:
+            lifestyle = lifestyle + np.where(size <= 1, 1.0, 0.3)
+            lifestyle_weight = lifestyle_weight + 1.0
+
+        lifestyle = lifestyle + np.where(large, 1.0 if u["has_yard"] else 0.5, 0.0)
+        lifestyle_weight = lifestyle_weight + np.where(large, 1.0, 0.0)
+
+        hours_alone = u["hours_alone"]
+        if hours_alone <= 4:
+            lifestyle = lifestyle + np.where(energy >= 1, 0.9, 0.7)
+        elif hours_alone <= 8:
+            lifestyle = lifestyle + np.select([energy == 1, energy == 0], [1.0, 0.8], 0.5)
+        else:
+            lifestyle = lifestyle + np.where(energy == 0, 1.0, 0.4)
+        lifestyle_weight = lifestyle_weight + 1.0
+
+        exercise = u["exercise_commitment"]
+        exercise_match = (
+            ((exercise >= 60) & (energy >= 1))
+            | ((exercise <= 30) & (energy == 0))
+            | ((abs(exercise - 30) < 15) & (energy == 1))
+        )
+        lifestyle = lifestyle + np.where(exercise_match, 1.0, 0.6)
+        lifestyle_weight = lifestyle_weight + 1.0
+
+        lifestyle = lifestyle / lifestyle_weight
+
+        # Personality compatibility
+        personality = np.zeros(n)
+        checks = 0
+
+        if u["has_children"]:
+            checks += 1
+            children = p["good_with_children"]
+            personality = personality + np.select([children > 0, children == 0], [1.0, 0.5], 0.0)
+
+        if u["has_other_pets"]:
+            checks += 2
+            dogs = p["good_with_dogs"]
+            cats = p["good_with_cats"]
+            personality = personality + np.where(dogs >= 0, 0.5 + (dogs * 0.5), 0.0)
+            personality = personality + np.where(cats >= 0, 0.5 + (cats * 0.5), 0.0)
+
+        checks += 1
+        activity_diff = np.abs(u["activity_level"] - energy.astype(np.int64))
+        personality = personality + np.select([activity_diff == 0, activity_diff == 1], [1.0, 0.6], 0.3)
+
+        checks += 1
+        experience = u["experience_level"]
+        special_needs_fit = 1.0 if experience >= 2 else 0.5 if experience == 1 else 0.2
+        high_energy_fit = 1.0 if experience >= 1 else 0.6
+        personality = personality + np.select(
+            [p["special_needs"], energy >= 2], [special_needs_fit, high_energy_fit], 1.0
+        )
+
+        personality = personality / checks
+
+        # Practical constraints
+        practical = np.ones(n)
+        for need, feature in (
+            ("needs_good_with_children", "good_with_children"),
+            ("needs_good_with_dogs", "good_with_dogs"),
+            ("needs_good_with_cats", "good_with_cats"),
+        ):
+            if u[need]:
+                values = p[feature]
+                practical = practical - np.select([values < 0, values == 0], [0.5, 0.2], 0.0)
+
+        if u["needs_house_trained"]:
+            practical = practical - np.where(p["house_trained"], 0.0, 0.3)
+
+        if not u["special_needs_ok"]:
+            practical = practical - np.where(p["special_needs"], 0.4, 0.0)
+
+        if experience == 0:
+            practical = practical - np.where(p["age"] == 3, 0.2, 0.0)
+
+        practical = np.maximum(practical, 0.0)
+
+        urgency = p["urgency_score"]
+
+        overall = (
+            lifestyle * self.weights["lifestyle"]
+            + personality * self.weights["personality"]
+            + practical * self.weights["practical"]
+            + urgency * self.weights["urgency"]
+        )
+
+        return {
+            "overall_score": overall,
+            "lifestyle_score": lifestyle,
+            "personality_score": personality,
+            "practical_score": practical,
+            "urgency_boost": urgency,
+        }
+
     def rank_pets(
-        self, user: UserProfile, pets: List[Pet], top_k: int = 10
+        self,
+        user: UserProfile,
+        pets: List[Pet],
+        top_k: int = 10,
+        min_score: Optional[float] = None
     ) -> List[Tuple[Pet, Dict[str, float]]]:
         """
         Rank a list of pets for a user.
@@ -413,17 +611,40 @@ class RecommendationModel:
             user: User profile
             pets: List of pet profiles
             top_k: Number of top results to return
+            min_score: Optional minimum overall score a pet must reach
 
         Returns:
             List of (pet, scores) tuples, sorted by overall score
         """
-        scored_pets = []
-
-        for pet in pets:
-            overall_score, scores = self.calculate_compatibility_score(user, pet)
-            scored_pets.append((pet, scores))
+        if not pets:
+            return []
 
-        # Sort by overall score descending
-        scored_pets.sort(key=lambda x: x[1]["overall_score"], reverse=True)
-
-        return scored_pets[:top_k]
+        try:
+            score_arrays = self.score_pets(user, pets)
+        except Exception as e:
+            logger.error(f"Error scoring pets in batch, scoring individually: {e}")
+            scored_pets = [
+                (pet, self.calculate_compatibility_score(user, pet)[1])
+                for pet in pets
+            ]
+            if min_score is not None:
+                scored_pets = [item for item in scored_pets if item[1]["overall_score"] >= min_score]
+            scored_pets.sort(key=lambda x: x[1]["overall_score"], reverse=True)
+            return scored_pets[:top_k]
+
+        # Rank on the rounded score, as reported, keeping input order for ties
+        columns = {name: values.tolist() for name, values in score_arrays.items()}
+        overall = np.array([round(score, 3) for score in columns["overall_score"]])
+        order = np.arange(len(overall))
+        if 0 < top_k < len(overall):
+            # Only pets tied with or above the k-th best score can make the cut
+            kth_best = -np.partition(-overall, top_k - 1)[top_k - 1]
+            order = order[overall >= kth_best]
+        order = order[np.argsort(-overall[order], kind="stable")]
+        if min_score is not None:
+            order = order[overall[order] >= min_score]
+
+        return [
+            (pets[i], {name: round(values[i], 3) for name, values in columns.items()})
+            for i in order[:top_k].tolist()
+        ]
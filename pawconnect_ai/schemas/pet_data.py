@@ -5,7 +5,7 @@ Pet data models and schemas.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict
+from pydantic import BaseModel, Field, HttpUrl, ConfigDict, PrivateAttr
 
 
 class PetType(str, Enum):
@@ -244,6 +244,9 @@ class Pet(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     last_synced: Optional[datetime] = Field(default=None)
 
+    # Encoded scoring features, computed once when the pet is fetched
+    _feature_row: Optional[tuple] = PrivateAttr(default=None)
+
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -4,7 +4,8 @@ Manages natural language dialogue and user interactions.
 Uses Google's Gemini AI for advanced natural language understanding.
 """
 
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 import json
 from loguru import logger
 
@@ -21,6 +22,71 @@ except ImportError:
     logger.warning("Vertex AI SDK not available. Falling back to keyword-based conversation.")
 
 
+@lru_cache(maxsize=4096)
+def _keyword_intent(message_lower: str) -> str:
+    """
+    Detect intent from a lowercased message using keyword patterns.
+
+    Memoized because the same short phrasings ("find me a dog", "hi")
+    make up most chat traffic.
+    """
+    # Intent patterns
+    if any(word in message_lower for word in ["search", "find", "look for", "looking for"]):
+        return "search_pets"
+    elif any(word in message_lower for word in ["adopt", "adoption", "get a pet"]):
+        return "adopt_pet"
+    elif any(word in message_lower for word in ["foster", "fostering", "temporary"]):
+        return "foster_pet"
+    elif any(word in message_lower for word in ["recommend", "suggest", "best match"]):
+        return "get_recommendations"
+    elif any(word in message_lower for word in ["visit", "meet", "schedule", "appointment"]):
+        return "schedule_visit"
+    elif any(word in message_lower for word in ["apply", "application", "adopt this"]):
+        return "submit_application"
+    elif any(word in message_lower for word in ["breed", "what is", "tell me about"]):
+        return "breed_info"
+    elif any(word in message_lower for word in ["care", "need", "require", "requirements"]):
+        return "care_info"
+    elif any(word in message_lower for word in ["hello", "hi", "hey", "greetings"]):
+        return "greeting"
+    elif any(word in message_lower for word in ["help", "assist", "support"]):
+        return "help"
+    else:
+        return "general_query"
+
+
+@lru_cache(maxsize=4096)
+def _keyword_entities(message_lower: str) -> Tuple[Tuple[str, str], ...]:
+    """Extract entities from a lowercased message as an immutable tuple of items."""
+    entities = {}
+
+    # Extract pet type
+    if "dog" in message_lower:
+        entities["pet_type"] = "dog"
+    elif "cat" in message_lower:
+        entities["pet_type"] = "cat"
+    elif "rabbit" in message_lower:
+        entities["pet_type"] = "rabbit"
+
+    # Extract size
+    if "small" in message_lower:
+        entities["size"] = "small"
+    elif "medium" in message_lower:
+        entities["size"] = "medium"
+    elif "large" in message_lower:
+        entities["size"] = "large"
+
+    # Extract age
+    if any(word in message_lower for word in ["puppy", "kitten", "baby"]):
+        entities["age"] = "baby"
+    elif "young" in message_lower:
+        entities["age"] = "young"
+    elif "senior" in message_lower:
+        entities["age"] = "senior"
+
+    return tuple(entities.items())
+
+
 class ConversationAgent:
     """
     Specialized agent for managing conversations and extracting user preferences.
@@ -224,62 +290,12 @@ Respond with ONLY the JSON, no additional text."""
 
     def _detect_intent(self, message: str) -> str:
         """Detect user intent from message."""
-        message_lower = message.lower()
-
-        # Intent patterns
-        if any(word in message_lower for word in ["search", "find", "look for", "looking for"]):
-            return "search_pets"
-        elif any(word in message_lower for word in ["adopt", "adoption", "get a pet"]):
-            return "adopt_pet"
-        elif any(word in message_lower for word in ["foster", "fostering", "temporary"]):
-            return "foster_pet"
-        elif any(word in message_lower for word in ["recommend", "suggest", "best match"]):
-            return "get_recommendations"
-        elif any(word in message_lower for word in ["visit", "meet", "schedule", "appointment"]):
-            return "schedule_visit"
-        elif any(word in message_lower for word in ["apply", "application", "adopt this"]):
-            return "submit_application"
-        elif any(word in message_lower for word in ["breed", "what is", "tell me about"]):
-            return "breed_info"
-        elif any(word in message_lower for word in ["care", "need", "require", "requirements"]):
-            return "care_info"
-        elif any(word in message_lower for word in ["hello", "hi", "hey", "greetings"]):
-            return "greeting"
-        elif any(word in message_lower for word in ["help", "assist", "support"]):
-            return "help"
-        else:
-            return "general_query"
+        return _keyword_intent(message.lower())
 
     def _extract_entities(self, message: str, intent: str) -> Dict[str, Any]:
         """Extract entities from message based on intent."""
-        entities = {}
-        message_lower = message.lower()
-
-        # Extract pet type
-        if "dog" in message_lower:
-            entities["pet_type"] = "dog"
-        elif "cat" in message_lower:
-            entities["pet_type"] = "cat"
-        elif "rabbit" in message_lower:
-            entities["pet_type"] = "rabbit"
-
-        # Extract size
-        if "small" in message_lower:
-            entities["size"] = "small"
-        elif "medium" in message_lower:
-            entities["size"] = "medium"
-        elif "large" in message_lower:
-            entities["size"] = "large"
-
-        # Extract age
-        if any(word in message_lower for word in ["puppy", "kitten", "baby"]):
-            entities["age"] = "baby"
-        elif "young" in message_lower:
-            entities["age"] = "young"
-        elif "senior" in message_lower:
-            entities["age"] = "senior"
-
-        return entities
+        # Copy so callers can't mutate the memoized result
+        return dict(_keyword_entities(message.lower()))
 
     def _generate_response(
         self,
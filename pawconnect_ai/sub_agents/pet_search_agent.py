@@ -12,6 +12,13 @@ from ..schemas.pet_data import Pet
 from ..utils.api_clients import rescuegroups_client
 from ..utils.helpers import parse_rescuegroups_response
 from ..utils.validators import validate_search_params
+from ..utils.cache import TTLCache
+
+# Shown alongside last-good results served while RescueGroups is failing
+STALE_NOTICE = (
+    "Shelter listings could not be refreshed right now, so these results may be "
+    "out of date. Please confirm availability with the rescue."
+)
 
 
 class PetSearchAgent:
@@ -22,7 +29,23 @@ class PetSearchAgent:
     def __init__(self):
         """Initialize the pet search agent."""
         self.rescuegroups = rescuegroups_client
-        self.cache = {}  # Simple in-memory cache
+        # Shelter inventory changes slowly, so identical searches within the
+        # TTL are served from memory
+        self.cache = TTLCache(
+            maxsize=settings.shelter_cache_max_entries,
+            ttl=settings.shelter_cache_ttl
+        )
+        # Last successful result per search, served if RescueGroups starts failing
+        self._last_good = TTLCache(
+            maxsize=settings.shelter_cache_max_entries,
+            ttl=settings.shelter_stale_ttl
+        )
+        # Searches whose latest result is a last-good fallback rather than a fresh fetch
+        self._stale_keys = TTLCache(
+            maxsize=settings.shelter_cache_max_entries,
+            ttl=settings.shelter_stale_ttl
+        )
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     async def search_pets(
         self,
@@ -52,15 +75,77 @@ class PetSearchAgent:
             return []
 
         # Check cache
-        cache_key = f"{pet_type}:{location}:{distance}:{limit}"
-        if cache_key in self.cache:
+        cache_key = self._make_cache_key(pet_type, location, distance, limit, **kwargs)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
             logger.info("Returning cached search results")
-            return self.cache[cache_key]
+            logger.debug("Shelter cache hit rate: {:.1%}", self.cache.hit_rate)
+            return cached
+
+        # Single-flight: concurrent identical searches share one in-flight fetch,
+        # including its fallback result if RescueGroups fails
+        fetch = self._inflight.get(cache_key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_pets(
+                cache_key,
+                pet_type=pet_type,
+                location=location,
+                distance=distance,
+                limit=limit,
+                **kwargs
+            ))
+            self._inflight[cache_key] = fetch
+            fetch.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+
+        # Shielded so one caller going away does not cancel the others' fetch
+        return await asyncio.shield(fetch)
+
+    def is_stale(
+        self,
+        pet_type: Optional[str] = None,
+        location: Optional[str] = None,
+        distance: int = 50,
+        limit: int = 100,
+        **kwargs
+    ) -> bool:
+        """
+        Check whether the latest results for a search are a last-good fallback.
+
+        Takes the same arguments as search_pets.
+
+        Returns:
+            True if RescueGroups failed and older results were served instead
+        """
+        cache_key = self._make_cache_key(pet_type, location, distance, limit, **kwargs)
+        return cache_key in self._stale_keys
+
+    async def _fetch_pets(
+        self,
+        cache_key: str,
+        pet_type: Optional[str],
+        location: Optional[str],
+        distance: int,
+        limit: int,
+        **kwargs
+    ) -> List[Pet]:
+        """
+        Fetch a search from RescueGroups and cache the result.
+
+        Args:
+            cache_key: Normalized key for the search
+            pet_type: Type of pet (dog, cat, etc.)
+            location: ZIP code or city, state
+            distance: Search radius in miles
+            limit: Maximum number of results
+            **kwargs: Additional search parameters
 
+        Returns:
+            List of Pet objects, the last good results, or an empty list on error
+        """
         try:
             logger.info(
-                f"Searching for pets: type={pet_type}, location={location}, "
-                f"distance={distance}, limit={limit}"
+                "Searching for pets: type={}, location={}, distance={}, limit={}",
+                pet_type, location, distance, limit
             )
 
             # Search RescueGroups API
@@ -74,14 +159,39 @@ class PetSearchAgent:
 
             # Cache results
             self.cache[cache_key] = pets
+            self._stale_keys.pop(cache_key, None)
+            if pets:
+                self._last_good[cache_key] = pets
 
-            logger.info(f"Found {len(pets)} pets")
+            logger.info("Found {} pets", len(pets))
             return pets
 
         except Exception as e:
-            logger.error(f"Error searching for pets: {e}")
+            # Degrade to the last good results rather than showing nothing
+            stale = self._last_good.get(cache_key)
+            if stale is not None:
+                logger.warning("Search failed, serving last good results: {}", e)
+                self._stale_keys[cache_key] = True
+                return stale
+
+            logger.error("Error searching for pets: {}", e)
+            self._stale_keys.pop(cache_key, None)
             return []
 
+    @staticmethod
+    def _make_cache_key(
+        pet_type: Optional[str],
+        location: Optional[str],
+        distance: int,
+        limit: int,
+        **kwargs
+    ) -> str:
+        """Build a normalized cache key for a search."""
+        pet_type = pet_type.strip().lower() if pet_type else None
+        location = location.strip().lower() if location else None
+        extra = ",".join(f"{k}={v}" for k, v in sorted(kwargs.items()) if v)
+        return f"{pet_type}:{location}:{distance}:{limit}:{extra}"
+
     async def _search_rescuegroups(
         self,
         pet_type: Optional[str] = None,
@@ -121,10 +231,8 @@ class PetSearchAgent:
 
         except Exception as e:
             logger.error(f"RescueGroups API error: {e}")
-            # Return mock data in case of error if in testing mode
-            if settings.testing_mode or settings.mock_apis:
-                return self._get_mock_pets(pet_type, limit)
-            return []
+            # Let search_pets fall back to last good results instead of caching an empty list
+            raise
 
     def _get_mock_pets(self, pet_type: Optional[str], limit: int) -> List[Pet]:
         """Get mock pet data for testing."""
@@ -275,4 +383,6 @@ class PetSearchAgent:
     def clear_cache(self):
         """Clear the search cache."""
         self.cache.clear()
+        self._last_good.clear()
+        self._stale_keys.clear()
         logger.info("Search cache cleared")
@@ -48,19 +48,15 @@ class RecommendationAgent:
         min_score = min_score or self.min_score
 
         try:
-            logger.info(f"Generating recommendations for user {user.user_id} from {len(pets)} pets")
+            logger.debug("Generating recommendations for user {} from {} pets", user.user_id, len(pets))
 
-            # Use model to rank pets
-            ranked_pets = self.model.rank_pets(user, pets, top_k=len(pets))
+            # Score all pets in one pass, keeping only the top matches above the threshold
+            ranked_pets = self.model.rank_pets(user, pets, top_k=top_k, min_score=min_score)
 
-            # Filter by minimum score and create PetMatch objects
+            # Create PetMatch objects
             matches = []
-            rank = 1
-
-            for pet, scores in ranked_pets:
-                if scores["overall_score"] < min_score:
-                    continue
 
+            for rank, (pet, scores) in enumerate(ranked_pets, start=1):
                 # Generate explanation
                 explanation, key_factors, concerns = format_match_explanation(
                     pet, user, scores
@@ -82,12 +78,8 @@ class RecommendationAgent:
                 )
 
                 matches.append(match)
-                rank += 1
-
-                if len(matches) >= top_k:
-                    break
 
-            logger.info(f"Generated {len(matches)} recommendations (scores >= {min_score})")
+            logger.info("Generated {} recommendations (scores >= {})", len(matches), min_score)
             return matches
 
         except Exception as e:
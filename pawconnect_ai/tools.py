@@ -29,6 +29,11 @@ class PawConnectTools:
         self.vision_agent = VisionAgent()
         self.workflow_agent = WorkflowAgent()
 
+    async def close(self) -> None:
+        """Release pooled HTTP connections held by the API clients."""
+        await self.search_agent.rescuegroups.close()
+        await self.vision_agent.google_client.close()
+
     async def fetch_shelter_data(
         self,
         pet_type: Optional[str] = None,
@@ -51,7 +56,7 @@ class PawConnectTools:
             List of Pet objects
         """
         try:
-            logger.info(f"Fetching shelter data: type={pet_type}, location={location}")
+            logger.debug("Fetching shelter data: type={}, location={}", pet_type, location)
 
             pets = await self.search_agent.search_pets(
                 pet_type=pet_type,
@@ -61,6 +66,9 @@ class PawConnectTools:
                 **kwargs
             )
 
+            # Encode scoring features once, so recommendations over these pets skip it
+            self.recommendation_agent.model.precompute_pet_features(pets)
+
             return pets
 
         except Exception as e:
@@ -221,48 +229,14 @@ class PawConnectTools:
                 "email_sent": False,
             }
 
-            # Create calendar event if enabled
+            # Calendar event and confirmation email are independent, so run them concurrently
+            notifications = []
             if settings.mcp_calendar_enabled:
-                try:
-                    calendar_client = get_calendar_client()
-                    calendar_result = await calendar_client.create_visit_event(
-                        user_name=user_name,
-                        user_email=user_email,
-                        pet_name=pet.name,
-                        pet_id=pet_id,
-                        visit_datetime=preferred_time,
-                        duration_minutes=duration_minutes,
-                        shelter_name=shelter_name,
-                        shelter_address=shelter_address,
-                        visit_id=visit_id,
-                    )
-                    visit_info["calendar_event_id"] = calendar_result.get("event_id")
-                    visit_info["calendar_link"] = calendar_result.get("html_link") or calendar_result.get("web_link")
-                    logger.info(f"Calendar event created: {calendar_result.get('event_id')}")
-                except Exception as e:
-                    logger.warning(f"Failed to create calendar event: {e}")
-                    visit_info["calendar_error"] = str(e)
-
-            # Send confirmation email if enabled
+                notifications.append(self._create_visit_event(visit_info, preferred_time))
             if settings.mcp_email_enabled and settings.email_notify_visit_scheduled:
-                try:
-                    email_client = get_email_client()
-                    email_result = await email_client.send_visit_confirmation(
-                        to_email=user_email,
-                        user_name=user_name,
-                        pet_name=pet.name,
-                        pet_id=pet_id,
-                        visit_datetime=preferred_time,
-                        shelter_name=shelter_name,
-                        shelter_address=shelter_address,
-                        visit_id=visit_id,
-                    )
-                    visit_info["email_sent"] = email_result.get("status") == "success"
-                    visit_info["email_message_id"] = email_result.get("message_id")
-                    logger.info(f"Confirmation email sent: {email_result.get('message_id')}")
-                except Exception as e:
-                    logger.warning(f"Failed to send confirmation email: {e}")
-                    visit_info["email_error"] = str(e)
+                notifications.append(self._send_visit_confirmation(visit_info, preferred_time))
+            if notifications:
+                await asyncio.gather(*notifications)
 
             logger.info(f"Visit scheduled successfully: {visit_id}")
             return visit_info
@@ -271,6 +245,49 @@ class PawConnectTools:
             logger.error(f"Error scheduling visit: {e}")
             raise
 
+    async def _create_visit_event(self, visit_info: Dict[str, Any], visit_datetime: datetime) -> None:
+        """Create the calendar event for a visit, recording the outcome on visit_info."""
+        try:
+            calendar_client = get_calendar_client()
+            calendar_result = await calendar_client.create_visit_event(
+                user_name=visit_info["user_name"],
+                user_email=visit_info["user_email"],
+                pet_name=visit_info["pet_name"],
+                pet_id=visit_info["pet_id"],
+                visit_datetime=visit_datetime,
+                duration_minutes=visit_info["duration_minutes"],
+                shelter_name=visit_info["shelter_name"],
+                shelter_address=visit_info["shelter_address"],
+                visit_id=visit_info["visit_id"],
+            )
+            visit_info["calendar_event_id"] = calendar_result.get("event_id")
+            visit_info["calendar_link"] = calendar_result.get("html_link") or calendar_result.get("web_link")
+            logger.info(f"Calendar event created: {calendar_result.get('event_id')}")
+        except Exception as e:
+            logger.warning(f"Failed to create calendar event: {e}")
+            visit_info["calendar_error"] = str(e)
+
+    async def _send_visit_confirmation(self, visit_info: Dict[str, Any], visit_datetime: datetime) -> None:
+        """Send the visit confirmation email, recording the outcome on visit_info."""
+        try:
+            email_client = get_email_client()
+            email_result = await email_client.send_visit_confirmation(
+                to_email=visit_info["user_email"],
+                user_name=visit_info["user_name"],
+                pet_name=visit_info["pet_name"],
+                pet_id=visit_info["pet_id"],
+                visit_datetime=visit_datetime,
+                shelter_name=visit_info["shelter_name"],
+                shelter_address=visit_info["shelter_address"],
+                visit_id=visit_info["visit_id"],
+            )
+            visit_info["email_sent"] = email_result.get("status") == "success"
+            visit_info["email_message_id"] = email_result.get("message_id")
+            logger.info(f"Confirmation email sent: {email_result.get('message_id')}")
+        except Exception as e:
+            logger.warning(f"Failed to send confirmation email: {e}")
+            visit_info["email_error"] = str(e)
+
     def process_application(
         self,
         user_id: str,
@@ -384,3 +401,15 @@ class PawConnectTools:
             List of application dictionaries
         """
         return self.workflow_agent.get_user_applications(user_id)
+
+
+# Global tools instance, shared so sub-agent caches persist across requests
+_tools: Optional[PawConnectTools] = None
+
+
+def get_tools() -> PawConnectTools:
+    """Get or create global tools instance."""
+    global _tools
+    if _tools is None:
+        _tools = PawConnectTools()
+    return _tools
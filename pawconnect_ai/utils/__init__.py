@@ -8,6 +8,7 @@ from .api_clients import (
 )
 from .validators import validate_user_input, validate_pet_data
 from .helpers import calculate_distance, format_pet_profile
+from .cache import TTLCache
 
 __all__ = [
     "RescueGroupsClient",
@@ -18,4 +19,5 @@ __all__ = [
     "validate_pet_data",
     "calculate_distance",
     "format_pet_profile",
+    "TTLCache",
 ]
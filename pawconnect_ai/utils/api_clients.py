@@ -9,12 +9,88 @@ import json
 import hashlib
 from typing import List, Dict, Any, Optional
 import aiohttp
-import requests
+import orjson
 from loguru import logger
 
 from ..config import settings
 from ..schemas.pet_data import Pet, PetType
 
+# Payloads may carry int keys or numpy values from the scoring path, which
+# stdlib json accepted and orjson rejects without these options
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+async def _close_stale_session(
+    session: aiohttp.ClientSession,
+    loop: asyncio.AbstractEventLoop
+) -> None:
+    """
+    Close an HTTP session created on a different event loop.
+
+    A session can only shut its connections down cleanly on the loop that
+    created it. If that loop is still running in another thread the session
+    is closed there; if it has already stopped, the session is marked closed
+    here and its sockets are released along with the old loop's transports.
+
+    Args:
+        session: Session to close
+        loop: Event loop the session was created on
+    """
+    if session.closed:
+        return
+
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+
+    logger.warning("HTTP session outlived its event loop; close the client before the loop shuts down")
+    try:
+        await session.close()
+    except Exception as e:
+        logger.debug("Could not close stale HTTP session: {}", e)
+
+
+class SharedSession:
+    """
+    Lazily created aiohttp session bound to the running event loop.
+
+    Reusing one session keeps the connection pool and keep-alive
+    connections, so repeat requests skip the TCP and TLS handshakes.
+    A new session is created if the previous one was closed or belongs
+    to a different event loop; call close() before a loop shuts down so
+    its session is released on that loop.
+    """
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Get the session for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None and self._loop is not loop:
+                await _close_stale_session(self._session, self._loop)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=settings.api_connection_limit,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+            )
+            self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session."""
+        if self._session is not None:
+            if self._loop is asyncio.get_running_loop():
+                await self._session.close()
+            else:
+                await _close_stale_session(self._session, self._loop)
+        self._session = None
+        self._loop = None
+
 
 class RateLimiter:
     """Rate limiter for API calls."""
@@ -52,6 +128,17 @@ class RescueGroupsClient:
         self.base_url = base_url or settings.rescuegroups_base_url
         self.rate_limiter = RateLimiter(settings.api_rate_limit)
 
+        # Shared HTTP session, created lazily on the running event loop
+        self._http = SharedSession()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session shared by all requests."""
+        return await self._http.get()
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        await self._http.close()
+
     def _get_headers(self) -> Dict[str, str]:
         """Get API request headers with authentication."""
         return {
@@ -203,29 +290,29 @@ class RescueGroupsClient:
         logger.info(f"RescueGroups API URL: {api_url}")
         logger.info(f"RescueGroups API request body: {request_body}")
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                api_url,
-                headers=headers,
-                json=request_body,
-                timeout=aiohttp.ClientTimeout(total=settings.api_timeout),
-            ) as response:
-                if response.status != 200:
-                    # Get error details
-                    error_text = await response.text()
-                    logger.error(
-                        f"RescueGroups API error: {response.status}, "
-                        f"message='{response.reason}', "
-                        f"url='{response.url}', "
-                        f"response='{error_text}'"
-                    )
-                response.raise_for_status()
-
-                # Get result and cache it
-                result = await response.json()
-                if google_cloud_client:
-                    google_cloud_client.set_cache(cache_key, result)
-                return result
+        session = await self._get_session()
+        async with session.post(
+            api_url,
+            headers=headers,
+            json=request_body,
+            timeout=aiohttp.ClientTimeout(total=settings.api_timeout),
+        ) as response:
+            if response.status != 200:
+                # Get error details
+                error_text = await response.text()
+                logger.error(
+                    f"RescueGroups API error: {response.status}, "
+                    f"message='{response.reason}', "
+                    f"url='{response.url}', "
+                    f"response='{error_text}'"
+                )
+            response.raise_for_status()
+
+            # Get result and cache it
+            result = await response.json(loads=orjson.loads)
+            if google_cloud_client:
+                google_cloud_client.set_cache(cache_key, result)
+            return result
 
     async def get_pet(self, pet_id: str) -> Dict[str, Any]:
         """
@@ -272,71 +359,71 @@ class RescueGroupsClient:
         logger.info(f"Fetching pet with ID: {pet_id}")
         logger.debug(f"RescueGroups GET {api_url} with params: {params}")
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                api_url,
-                headers=headers,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=settings.api_timeout),
-            ) as response:
-                if response.status == 404:
-                    # Pet not found - return empty result
-                    logger.info(f"Pet {pet_id} not found (404)")
-                    return {"data": None}
+        session = await self._get_session()
+        async with session.get(
+            api_url,
+            headers=headers,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=settings.api_timeout),
+        ) as response:
+            if response.status == 404:
+                # Pet not found - return empty result
+                logger.info(f"Pet {pet_id} not found (404)")
+                return {"data": None}
+
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(
+                    f"RescueGroups API error for pet {pet_id}: {response.status}, "
+                    f"response: {error_text}"
+                )
+                # Return empty result instead of raising error
+                return {"data": None}
+
+            result = await response.json(loads=orjson.loads)
+
+            # Log the result for debugging
+            # RescueGroups GET endpoint returns {"data": {...}, "included": [...]}
+            # where data is a SINGLE object (not an array)
+            if result.get("data"):
+                pet_data = result["data"]
+
+                # Check if it's an array (shouldn't be for GET, but handle it)
+                if isinstance(pet_data, list):
+                    logger.warning(f"GET endpoint returned array instead of object")
+                    if len(pet_data) == 0:
+                        logger.info(f"get_pet({pet_id}) returned empty array")
+                        return {"data": None}
+                    # Take first item
+                    pet_data = pet_data[0]
+                    # Update result to have single object
+                    result["data"] = pet_data
+
+                returned_id = pet_data.get("id")
+                attributes = pet_data.get("attributes", {})
+                pet_name = attributes.get("name", "Unknown")
+                species = attributes.get("species", attributes.get("speciesid", "Unknown"))
+
+                # Log available attributes for debugging
+                logger.debug(f"Available attributes for pet {pet_id}: {list(attributes.keys())}")
 
-                if response.status != 200:
-                    error_text = await response.text()
+                logger.info(
+                    f"get_pet({pet_id}) found: {pet_name} (ID: {returned_id}, Species: {species})"
+                )
+
+                # Verify we got the correct pet
+                if returned_id and str(returned_id) != str(pet_id):
                     logger.error(
-                        f"RescueGroups API error for pet {pet_id}: {response.status}, "
-                        f"response: {error_text}"
+                        f"API returned wrong pet! Requested: {pet_id}, Got: {returned_id}"
                     )
-                    # Return empty result instead of raising error
                     return {"data": None}
+            else:
+                logger.info(f"get_pet({pet_id}) returned no data")
 
-                result = await response.json()
-
-                # Log the result for debugging
-                # RescueGroups GET endpoint returns {"data": {...}, "included": [...]}
-                # where data is a SINGLE object (not an array)
-                if result.get("data"):
-                    pet_data = result["data"]
-
-                    # Check if it's an array (shouldn't be for GET, but handle it)
-                    if isinstance(pet_data, list):
-                        logger.warning(f"GET endpoint returned array instead of object")
-                        if len(pet_data) == 0:
-                            logger.info(f"get_pet({pet_id}) returned empty array")
-                            return {"data": None}
-                        # Take first item
-                        pet_data = pet_data[0]
-                        # Update result to have single object
-                        result["data"] = pet_data
-
-                    returned_id = pet_data.get("id")
-                    attributes = pet_data.get("attributes", {})
-                    pet_name = attributes.get("name", "Unknown")
-                    species = attributes.get("species", attributes.get("speciesid", "Unknown"))
-
-                    # Log available attributes for debugging
-                    logger.debug(f"Available attributes for pet {pet_id}: {list(attributes.keys())}")
-
-                    logger.info(
-                        f"get_pet({pet_id}) found: {pet_name} (ID: {returned_id}, Species: {species})"
-                    )
-
-                    # Verify we got the correct pet
-                    if returned_id and str(returned_id) != str(pet_id):
-                        logger.error(
-                            f"API returned wrong pet! Requested: {pet_id}, Got: {returned_id}"
-                        )
-                        return {"data": None}
-                else:
-                    logger.info(f"get_pet({pet_id}) returned no data")
-
-                # Cache the result (even if data is None, to avoid repeated lookups)
-                if google_cloud_client:
-                    google_cloud_client.set_cache(cache_key, result)
-                return result
+            # Cache the result (even if data is None, to avoid repeated lookups)
+            if google_cloud_client:
+                google_cloud_client.set_cache(cache_key, result)
+            return result
 
     async def get_organizations(
         self, location: Optional[str] = None, limit: int = 100
@@ -366,15 +453,15 @@ class RescueGroupsClient:
             "limit": str(min(limit, 250))
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/public/orgs/search",
-                headers=headers,
-                json=request_body,
-                timeout=aiohttp.ClientTimeout(total=settings.api_timeout),
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/public/orgs/search",
+            headers=headers,
+            json=request_body,
+            timeout=aiohttp.ClientTimeout(total=settings.api_timeout),
+        ) as response:
+            response.raise_for_status()
+            return await response.json(loads=orjson.loads)
 
 
 class GoogleCloudClient:
@@ -392,6 +479,22 @@ class GoogleCloudClient:
         self._pubsub_subscriber = None
         self._redis_client = None
 
+        # Shared HTTP session for image downloads, created lazily on the running event loop
+        self._http = SharedSession()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session used to download images.
+
+        Photos are usually served from a handful of CDN hosts, so keeping
+        one pooled session lets repeat downloads reuse open connections.
+        """
+        return await self._http.get()
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        await self._http.close()
+
     @property
     def vision_client(self):
         """Get or create Vision API client."""
@@ -472,9 +575,9 @@ class GoogleCloudClient:
             image.source.image_uri = image_uri
         else:
             # For HTTP URLs, download and send content
-            async with aiohttp.ClientSession() as session:
-                async with session.get(image_uri) as response:
-                    image.content = await response.read()
+            session = await self._get_session()
+            async with session.get(image_uri) as response:
+                image.content = await response.read()
 
         # Perform multiple feature detections
         features = [
@@ -530,11 +633,9 @@ class GoogleCloudClient:
         Returns:
             Message ID
         """
-        import json
-
         topic_path = self.pubsub_publisher.topic_path(self.project_id, topic_name)
 
-        message_json = json.dumps(message).encode("utf-8")
+        message_json = orjson.dumps(message, option=ORJSON_OPTIONS)
 
         # Run in executor to avoid blocking
         loop = asyncio.get_event_loop()
@@ -667,7 +768,7 @@ class GoogleCloudClient:
             cached = self.redis_client.get(cache_key)
             if cached:
                 logger.debug(f"Cache HIT for key: {cache_key}")
-                return json.loads(cached)
+                return orjson.loads(cached)
             logger.debug(f"Cache MISS for key: {cache_key}")
             return None
         except Exception as e:
@@ -694,7 +795,7 @@ class GoogleCloudClient:
             self.redis_client.setex(
                 cache_key,
                 ttl,
-                json.dumps(data),
+                orjson.dumps(data, option=ORJSON_OPTIONS),
             )
             logger.debug(f"Cached data for key: {cache_key} (TTL: {ttl}s)")
         except Exception as e:
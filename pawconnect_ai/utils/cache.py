@@ -0,0 +1,115 @@
+"""
+In-memory caching utilities for PawConnect AI.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache with per-entry expiry and LRU eviction.
+
+    Entries expire ``ttl`` seconds after they are written. When the cache
+    grows past ``maxsize`` the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Time-to-live for each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of get() lookups that found a live entry."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a live entry, marking it as recently used."""
+        value = self._lookup(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Return a live entry's value or _MISSING, without counting the lookup."""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return _MISSING
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used ones if full."""
+        ttl = self.ttl if ttl is None else ttl
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value if it was still live."""
+        value = self._lookup(key)
+        self._data.pop(key, None)
+        return default if value is _MISSING else value
+
+    def expire(self) -> int:
+        """
+        Drop all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._data.items() if now >= expires_at]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
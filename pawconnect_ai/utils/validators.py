@@ -10,6 +10,22 @@ from loguru import logger
 from ..schemas.user_profile import UserProfile, UserPreferences
 from ..schemas.pet_data import Pet
 
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+PHONE_FORMATTING_PATTERN = re.compile(r"[^\d+]")
+# Support both 5-digit and ZIP+4 formats
+ZIP_CODE_PATTERN = re.compile(r"^\d{5}(-\d{4})?$")
+# "City, State" with optional whitespace around either part
+CITY_STATE_PATTERN = re.compile(r"^\s*([^,]+?)\s*,\s*([^,]+?)\s*$")
+
+VALID_STATE_CODES = frozenset({
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+    "DC", "PR", "VI", "GU", "AS", "MP"
+})
+
 
 def sanitize_string(value: str, max_length: int = 1000) -> str:
     """
@@ -47,8 +63,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email format
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(EMAIL_PATTERN.match(email))
 
 
 def validate_phone(phone: str) -> bool:
@@ -62,7 +77,7 @@ def validate_phone(phone: str) -> bool:
         True if valid phone format
     """
     # Remove common formatting characters
-    cleaned = re.sub(r"[^\d+]", "", phone)
+    cleaned = PHONE_FORMATTING_PATTERN.sub("", phone)
 
     # Check if it's a reasonable length
     return 10 <= len(cleaned) <= 15
@@ -78,9 +93,7 @@ def validate_zip_code(zip_code: str) -> bool:
     Returns:
         True if valid ZIP code format
     """
-    # Support both 5-digit and ZIP+4 formats
-    pattern = r"^\d{5}(-\d{4})?$"
-    return bool(re.match(pattern, zip_code))
+    return bool(ZIP_CODE_PATTERN.match(zip_code))
 
 
 def validate_state_code(state: str) -> bool:
@@ -93,15 +106,7 @@ def validate_state_code(state: str) -> bool:
     Returns:
         True if valid state code
     """
-    valid_states = {
-        "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
-        "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
-        "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-        "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
-        "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
-        "DC", "PR", "VI", "GU", "AS", "MP"
-    }
-    return state.upper() in valid_states
+    return state.upper() in VALID_STATE_CODES
 
 
 def validate_user_input(data: Dict[str, Any]) -> tuple[bool, Optional[str], Optional[UserProfile]]:
@@ -142,7 +147,7 @@ def validate_user_input(data: Dict[str, Any]) -> tuple[bool, Optional[str], Opti
             return False, "Invalid state code", None
 
         # Create and validate UserProfile
-        user_profile = UserProfile(**data)
+        user_profile = UserProfile.model_validate(data)
         return True, None, user_profile
 
     except ValidationError as e:
@@ -173,7 +178,7 @@ def validate_pet_data(data: Dict[str, Any]) -> tuple[bool, Optional[str], Option
             data["story"] = sanitize_string(data["story"], 5000)
 
         # Create and validate Pet
-        pet = Pet(**data)
+        pet = Pet.model_validate(data)
         return True, None, pet
 
     except ValidationError as e:
@@ -24,6 +24,7 @@ base_requirements = [
     "redis>=5.0.0",
     "loguru>=0.7.2",
     "numpy>=1.26.0",
+    "orjson>=3.9.0",
     "python-dateutil>=2.8.2",
     "aiofiles>=23.2.1",
     "geopy>=2.4.1",
@@ -62,6 +62,37 @@ class TestRescueGroupsIntegration:
         if cats:  # May be empty in test mode
             assert all(pet.species.value == "cat" for pet in cats)
 
+    @pytest.mark.asyncio
+    async def test_http_session_reused(self, rescuegroups_client):
+        """Test that requests share one pooled HTTP session."""
+        session1 = await rescuegroups_client._get_session()
+        session2 = await rescuegroups_client._get_session()
+
+        assert session1 is session2
+
+        await rescuegroups_client.close()
+        assert session1.closed
+
+        # A fresh session is created after close
+        session3 = await rescuegroups_client._get_session()
+        assert session3 is not session1
+        await rescuegroups_client.close()
+
+    def test_http_session_from_previous_loop_closed(self, rescuegroups_client):
+        """Test that a session left on a finished event loop is closed when replaced."""
+        old_session = asyncio.run(rescuegroups_client._get_session())
+
+        async def switch_loop():
+            new_session = await rescuegroups_client._get_session()
+            await rescuegroups_client.close()
+            return new_session
+
+        new_session = asyncio.run(switch_loop())
+
+        assert new_session is not old_session
+        assert old_session.closed
+        assert new_session.closed
+
     @pytest.mark.asyncio
     async def test_get_pet_by_id(self, rescuegroups_client):
         """Test retrieving a specific pet by ID."""
@@ -125,6 +156,22 @@ class TestVisionIntegration:
         for analysis in analyses:
             assert hasattr(analysis, "model_version")
 
+    def test_image_session_from_previous_loop_closed(self):
+        """Test that the image download session is replaced cleanly across event loops."""
+        client = GoogleCloudClient()
+        old_session = asyncio.run(client._get_session())
+
+        async def switch_loop():
+            new_session = await client._get_session()
+            await client.close()
+            return new_session
+
+        new_session = asyncio.run(switch_loop())
+
+        assert new_session is not old_session
+        assert old_session.closed
+        assert new_session.closed
+
 
 class TestWorkflowIntegration:
     """Integration tests for workflow processes."""
@@ -5,9 +5,11 @@ Tests the complete workflow from user input to pet matching and application.
 
 import pytest
 import asyncio
+import time
 from datetime import datetime
+from unittest.mock import patch
 
-from pawconnect_ai.agent import PawConnectMainAgent
+from pawconnect_ai.agent import PawConnectMainAgent, get_agent
 from pawconnect_ai.schemas.user_profile import UserProfile, UserPreferences, PetType, PetSize, HomeType, ExperienceLevel
 from pawconnect_ai.schemas.pet_data import Pet
 from pawconnect_ai.config import settings
@@ -76,6 +78,24 @@ class TestAgentInitialization:
         assert agent.tools.vision_agent is not None
         assert agent.tools.workflow_agent is not None
 
+    def test_get_agent_returns_shared_instance(self):
+        """Test that get_agent reuses one agent per process."""
+        assert get_agent() is get_agent()
+
+    @pytest.mark.asyncio
+    async def test_closed_agent_rejects_requests(self, agent):
+        """Test that closing an agent leaves shared tools usable and rejects new requests."""
+        await agent.close()
+
+        with pytest.raises(RuntimeError):
+            await agent.process_user_request(user_id="test_user_closed", message="Help me")
+
+        # Other agents share the tools instance, so it keeps working
+        other = PawConnectMainAgent()
+        assert other.tools is agent.tools
+        pets = await other.tools.fetch_shelter_data(pet_type="dog", location="Seattle, WA", limit=5)
+        assert isinstance(pets, list)
+
 
 class TestUserProfileCreation:
     """Test user profile creation and validation."""
@@ -177,6 +197,19 @@ class TestPetSearchAndMatching:
                 assert hasattr(match, "practical_score")
                 assert hasattr(match, "urgency_boost")
 
+    @pytest.mark.asyncio
+    async def test_repeated_find_matches_uses_cache(self, agent, sample_user_data):
+        """Test that an unchanged profile reuses cached matches."""
+        user_profile = await agent.create_user_profile(sample_user_data)
+
+        first = await agent.find_matches(user_profile, top_k=5)
+
+        with patch.object(agent.tools, "search_and_recommend") as mock_search:
+            second = await agent.find_matches(user_profile, top_k=5)
+
+        mock_search.assert_not_called()
+        assert [m.pet.pet_id for m in second] == [m.pet.pet_id for m in first]
+
     @pytest.mark.asyncio
     async def test_compatibility_filtering(self, agent, sample_user_data):
         """Test that incompatible pets are filtered out or scored low."""
@@ -254,6 +287,161 @@ class TestConversationalInteraction:
 
             assert response.get("intent") == expected_intent or "response" in response
 
+    @pytest.mark.asyncio
+    async def test_sessions_are_bounded(self, agent):
+        """Test that the least recently active sessions are evicted."""
+        agent.user_sessions.maxsize = 2
+
+        for user_id in ["test_user_a", "test_user_b", "test_user_c"]:
+            await agent.process_user_request(user_id=user_id, message="Help me")
+
+        assert len(agent.user_sessions) == 2
+        assert agent.get_session("test_user_a") is None
+        assert agent.get_session("test_user_c") is not None
+
+    @pytest.mark.asyncio
+    async def test_in_flight_session_survives_eviction(self, agent):
+        """Test that filling the session store mid-request keeps the user on one session."""
+        agent.user_sessions.maxsize = 2
+        release = asyncio.Event()
+
+        async def slow_search(user_id, entities, session):
+            await release.wait()
+            session["context"]["searched"] = True
+            return {"response": "done", "intent": "search_pets"}
+
+        with patch.dict(agent._intent_handlers, {"search_pets": slow_search}):
+            first = asyncio.create_task(
+                agent.process_user_request(user_id="test_user_busy", message="Find a dog")
+            )
+            while not agent._active_sessions:
+                await asyncio.sleep(0)
+            session = agent.get_session("test_user_busy")
+
+            # Fill the store so the busy session is evicted from the LRU
+            for user_id in ["test_user_d", "test_user_e"]:
+                await agent.process_user_request(user_id=user_id, message="Help me")
+            assert "test_user_busy" not in agent.user_sessions
+
+            second = asyncio.create_task(
+                agent.process_user_request(user_id="test_user_busy", message="Find a dog")
+            )
+            await asyncio.sleep(0)
+            assert session["pending"] == 2
+
+            release.set()
+            await asyncio.gather(first, second)
+
+        assert agent.get_session("test_user_busy") is session
+        assert session["context"]["searched"]
+        assert session["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_same_user_serialized(self, agent):
+        """Test that concurrent requests from one user share a single session."""
+        user_id = "test_user_concurrent"
+
+        responses = await asyncio.gather(*[
+            agent.process_user_request(user_id=user_id, message="Help me")
+            for _ in range(3)
+        ])
+
+        assert all("response" in response for response in responses)
+        assert len(agent.user_sessions) == 1
+        assert not agent.get_session(user_id)["lock"].locked()
+
+    @pytest.mark.asyncio
+    async def test_request_burst_from_one_user_is_limited(self, agent):
+        """Test that requests beyond the per-user queue limit are turned away."""
+        async def slow_search(user_id, entities, session):
+            await asyncio.sleep(0.01)
+            return {"response": "done", "intent": "search_pets"}
+
+        limit = settings.max_pending_requests_per_user
+        with patch.dict(agent._intent_handlers, {"search_pets": slow_search}):
+            responses = await asyncio.gather(*[
+                agent.process_user_request(user_id="test_user_burst", message="Find a dog")
+                for _ in range(limit + 2)
+            ])
+
+        rejected = [r for r in responses if r.get("error") == "too_many_requests"]
+        assert len(rejected) == 2
+        assert agent.get_session("test_user_burst")["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_recommendations_reuse_results(self, agent, sample_user_data):
+        """Test that unchanged recommendation requests skip rescoring."""
+        user_profile = await agent.create_user_profile(sample_user_data)
+        user_id = user_profile.user_id
+
+        first = await agent.process_user_request(user_id, "Show me recommendations", user_profile)
+
+        with patch.object(agent.tools, "generate_recommendations") as mock_generate:
+            second = await agent.process_user_request(user_id, "Show me recommendations", user_profile)
+
+        mock_generate.assert_not_called()
+        assert second["recommendations"] == first["recommendations"]
+
+    @pytest.mark.asyncio
+    async def test_search_prefetches_recommendations(self, agent, sample_user_data):
+        """Test that a search starts scoring for the follow-up recommendation request."""
+        user_profile = await agent.create_user_profile(sample_user_data)
+        user_id = user_profile.user_id
+
+        search = await agent.process_user_request(user_id, "Find me a dog", user_profile)
+        assert search["pets_found"] > 0
+        assert "recommendations_task" in agent.get_session(user_id)
+
+        with patch.object(agent.tools, "generate_recommendations") as mock_generate:
+            result = await agent.process_user_request(user_id, "Show me recommendations", user_profile)
+
+        mock_generate.assert_not_called()
+        assert len(result["recommendations"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_prefetch_is_retried(self, agent, sample_user_data):
+        """Test that a failed scoring run is not reused by later requests."""
+        user_profile = await agent.create_user_profile(sample_user_data)
+        user_id = user_profile.user_id
+
+        with patch.object(agent.tools, "generate_recommendations", side_effect=Exception("Scoring error")):
+            await agent.process_user_request(user_id, "Find me a dog", user_profile)
+            failed = await agent.process_user_request(user_id, "Show me recommendations", user_profile)
+
+        assert "error" in failed
+
+        result = await agent.process_user_request(user_id, "Show me recommendations", user_profile)
+
+        assert len(result["recommendations"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_keeps_shared_scoring_run(self, agent, sample_user_data):
+        """Test that cancelling one recommendation request does not cancel the shared run."""
+        user_profile = await agent.create_user_profile(sample_user_data)
+        user_id = user_profile.user_id
+        generate = agent.tools.generate_recommendations
+        agent.conversation_agent.use_gemini = False
+
+        def slow_generate(**kwargs):
+            time.sleep(0.2)
+            return generate(**kwargs)
+
+        with patch.object(agent.tools, "generate_recommendations", side_effect=slow_generate) as mock_generate:
+            await agent.process_user_request(user_id, "Find me a dog", user_profile)
+
+            request = asyncio.ensure_future(
+                agent.process_user_request(user_id, "Show me recommendations", user_profile)
+            )
+            await asyncio.sleep(0.05)
+            request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+
+            result = await agent.process_user_request(user_id, "Show me recommendations", user_profile)
+
+        assert mock_generate.call_count == 1
+        assert len(result["recommendations"]) > 0
+
 
 class TestApplicationWorkflow:
     """Test application submission and processing workflow."""
@@ -0,0 +1,41 @@
+"""
+Unit tests for API client serialization.
+"""
+
+import pytest
+import numpy as np
+import orjson
+from unittest.mock import Mock
+
+from pawconnect_ai.utils.api_clients import GoogleCloudClient
+
+
+class TestGoogleCloudClientSerialization:
+    """Unit tests for GoogleCloudClient JSON payloads."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client with mocked Redis and Pub/Sub connections."""
+        client = GoogleCloudClient()
+        client._redis_client = Mock()
+        client._pubsub_publisher = Mock()
+        client._pubsub_publisher.topic_path.return_value = "projects/test/topics/events"
+        client._pubsub_publisher.publish.return_value.result.return_value = "message-1"
+        return client
+
+    def test_set_cache_non_str_keys(self, client):
+        """Test caching a payload with int keys and numpy values."""
+        client.set_cache("scores", {1: np.float32(0.5), "top": np.array([3, 1])}, ttl=60)
+
+        key, ttl, payload = client._redis_client.setex.call_args.args
+        assert (key, ttl) == ("scores", 60)
+        assert orjson.loads(payload) == {"1": 0.5, "top": [3, 1]}
+
+    @pytest.mark.asyncio
+    async def test_publish_message_non_str_keys(self, client):
+        """Test publishing a message with int keys."""
+        message_id = await client.publish_message("events", {"data": {7: "seen"}})
+
+        assert message_id == "message-1"
+        _, payload = client._pubsub_publisher.publish.call_args.args
+        assert orjson.loads(payload) == {"data": {"7": "seen"}}
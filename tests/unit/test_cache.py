@@ -0,0 +1,94 @@
+"""
+Unit tests for the in-memory TTL cache.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from pawconnect_ai.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Unit tests for TTLCache class."""
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache["key"] = "value"
+
+        assert cache.get("key") == "value"
+        assert cache["key"] == "value"
+        assert "key" in cache
+        assert len(cache) == 1
+
+    def test_missing_key(self):
+        """Test lookups of keys that were never stored."""
+        cache = TTLCache()
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+        assert "missing" not in cache
+        with pytest.raises(KeyError):
+            cache["missing"]
+
+    def test_entries_expire(self):
+        """Test that entries are dropped once their TTL has passed."""
+        cache = TTLCache(ttl=10)
+
+        with patch("pawconnect_ai.utils.cache.time.monotonic", return_value=100.0):
+            cache["key"] = "value"
+
+        with patch("pawconnect_ai.utils.cache.time.monotonic", return_value=105.0):
+            assert cache.get("key") == "value"
+
+        with patch("pawconnect_ai.utils.cache.time.monotonic", return_value=111.0):
+            assert cache.get("key") is None
+            assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+        cache["b"] = 2
+
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache["c"] = 3
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_expire_and_clear(self):
+        """Test bulk removal of expired and all entries."""
+        cache = TTLCache(ttl=10)
+
+        with patch("pawconnect_ai.utils.cache.time.monotonic", return_value=0.0):
+            cache["old"] = 1
+        with patch("pawconnect_ai.utils.cache.time.monotonic", return_value=8.0):
+            cache["new"] = 2
+
+        with patch("pawconnect_ai.utils.cache.time.monotonic", return_value=12.0):
+            assert cache.expire() == 1
+            assert "new" in cache
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_hit_rate(self):
+        """Test that get() lookups are counted as hits and misses."""
+        cache = TTLCache()
+        assert cache.hit_rate == 0.0
+
+        cache["key"] = "value"
+        cache.get("key")
+        cache.get("key")
+        cache.get("missing")
+
+        assert cache.hits == 2
+        assert cache.misses == 1
+        assert cache.hit_rate == pytest.approx(2 / 3)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -300,6 +300,16 @@ class TestConversationAgent:
         assert history1[0]["message"] == "Hello"
         assert history2[0]["message"] == "Hi there"
 
+    def test_repeated_message_entities_are_independent(self, conversation_agent_keyword):
+        """Test that memoized keyword results are not shared between calls."""
+        first = conversation_agent_keyword.process_user_input("user_a", "Find me a small dog")
+        first["entities"]["pet_type"] = "cat"
+
+        second = conversation_agent_keyword.process_user_input("user_b", "find me a SMALL dog")
+
+        assert second["intent"] == "search_pets"
+        assert second["entities"] == {"pet_type": "dog", "size": "small"}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -242,6 +242,77 @@ class TestRecommendationAgent:
         # Verify descending order
         assert top_k[0].overall_score >= top_k[1].overall_score >= top_k[2].overall_score
 
+    def test_batch_scores_match_individual_scores(self, recommendation_agent, sample_user_profile, sample_pets):
+        """Test that batched ranking reports the same scores as per-pet scoring."""
+        user = sample_user_profile.model_copy(deep=True)
+        user.preferences.has_children = True
+        user.preferences.has_other_pets = True
+        user.preferences.good_with_cats = True
+
+        senior_pet = sample_pets[0].model_copy(deep=True)
+        senior_pet.pet_id = "pet_003"
+        senior_pet.age = PetAge.SENIOR
+        senior_pet.days_in_shelter = 120
+        senior_pet.attributes.special_needs = True
+        senior_pet.attributes.good_with_children = None
+
+        pets = sample_pets + [senior_pet]
+        model = recommendation_agent.model
+
+        for profile in (sample_user_profile, user):
+            ranked = model.rank_pets(profile, pets, top_k=len(pets))
+
+            assert len(ranked) == len(pets)
+            for pet, scores in ranked:
+                _, expected = model.calculate_compatibility_score(profile, pet)
+                assert scores == expected
+
+    def test_rank_pets_top_k_matches_full_ranking(self, recommendation_agent, sample_user_profile, sample_pets):
+        """Test that partial top-k selection keeps the full ranking's order, ties included."""
+        model = recommendation_agent.model
+        all_pets = sample_pets * 5  # 10 pets with tied scores
+
+        full = model.rank_pets(sample_user_profile, all_pets, top_k=len(all_pets))
+
+        for top_k in range(1, len(all_pets)):
+            ranked = model.rank_pets(sample_user_profile, all_pets, top_k=top_k)
+            assert [id(pet) for pet, _ in ranked] == [id(pet) for pet, _ in full[:top_k]]
+
+    def test_precomputed_pet_features_reused(self, recommendation_agent, sample_user_profile, sample_pets):
+        """Test that precomputed pet features give the same ranking."""
+        model = recommendation_agent.model
+        expected = model.rank_pets(sample_user_profile, sample_pets)
+
+        model.precompute_pet_features(sample_pets)
+
+        assert all(pet._feature_row is not None for pet in sample_pets)
+        assert "_feature_row" not in sample_pets[0].model_dump()
+        assert model.rank_pets(sample_user_profile, sample_pets) == expected
+
+    def test_generate_recommendations_applies_min_score_and_top_k(
+        self, recommendation_agent, sample_user_profile, sample_pets
+    ):
+        """Test that recommendations respect the score threshold and top-k limit."""
+        all_pets = sample_pets * 5
+
+        matches = recommendation_agent.generate_recommendations(
+            user=sample_user_profile,
+            pets=all_pets,
+            top_k=3,
+            min_score=0.1
+        )
+
+        assert len(matches) == 3
+        assert [match.rank for match in matches] == [1, 2, 3]
+
+        none_match = recommendation_agent.generate_recommendations(
+            user=sample_user_profile,
+            pets=all_pets,
+            min_score=0.99
+        )
+
+        assert none_match == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -67,6 +67,64 @@ class TestPetSearchAgent:
         assert len(pets1) == len(pets2)
         assert pets1[0].pet_id == pets2[0].pet_id
 
+    @pytest.mark.asyncio
+    async def test_search_pets_cache_key_normalized(self, search_agent):
+        """Test that equivalent searches share a cache entry."""
+        search_agent._search_rescuegroups = AsyncMock(
+            return_value=search_agent._get_mock_pets("dog", 10)
+        )
+
+        await search_agent.search_pets(pet_type="dog", location="Seattle, WA")
+        await search_agent.search_pets(pet_type="Dog", location="  seattle, wa ")
+
+        assert search_agent._search_rescuegroups.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_search_pets_cache_hit_rate(self, search_agent):
+        """Test that a cold then warm search counts one miss and one hit."""
+        await search_agent.search_pets(pet_type="dog", location="Seattle, WA")
+        await search_agent.search_pets(pet_type="dog", location="Seattle, WA")
+
+        assert search_agent.cache.misses == 1
+        assert search_agent.cache.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_search_pets_concurrent_requests_coalesced(self, search_agent):
+        """Test that concurrent identical searches trigger a single fetch."""
+        async def slow_search(**kwargs):
+            await asyncio.sleep(0.01)
+            return search_agent._get_mock_pets("dog", 10)
+
+        search_agent._search_rescuegroups = AsyncMock(side_effect=slow_search)
+
+        results = await asyncio.gather(*[
+            search_agent.search_pets(pet_type="dog", location="98101")
+            for _ in range(5)
+        ])
+
+        assert search_agent._search_rescuegroups.await_count == 1
+        assert all(len(pets) == len(results[0]) for pets in results)
+
+    @pytest.mark.asyncio
+    async def test_search_pets_concurrent_failures_coalesced(self, search_agent):
+        """Test that concurrent identical searches share one failing fetch."""
+        async def failing_search(**kwargs):
+            await asyncio.sleep(0.01)
+            raise Exception("API Error")
+
+        search_agent._search_rescuegroups = AsyncMock(side_effect=failing_search)
+
+        first = asyncio.ensure_future(search_agent.search_pets(pet_type="dog", location="98101"))
+        await asyncio.sleep(0)
+        results = await asyncio.gather(first, *[
+            search_agent.search_pets(pet_type="dog", location="98101")
+            for _ in range(4)
+        ])
+
+        assert search_agent._search_rescuegroups.await_count == 1
+        assert results == [[]] * 5
+        assert not search_agent._inflight
+
     @pytest.mark.asyncio
     async def test_search_pets_empty_result(self, search_agent):
         """Test search with no results."""
@@ -163,6 +221,47 @@ class TestPetSearchAgent:
             # Should return empty list on error
             assert isinstance(pets, list)
 
+    @pytest.mark.asyncio
+    async def test_search_error_serves_last_good_results(self, search_agent):
+        """Test that a failing search falls back to the last successful results."""
+        pets = await search_agent.search_pets(pet_type="dog", location="Seattle, WA")
+        assert len(pets) > 0
+        assert not search_agent.is_stale(pet_type="dog", location="Seattle, WA")
+
+        # Expire the fresh entry, then make the API fail
+        search_agent.cache.clear()
+        with patch.object(
+            search_agent,
+            '_search_rescuegroups',
+            side_effect=Exception("API Error")
+        ):
+            stale = await search_agent.search_pets(pet_type="dog", location="Seattle, WA")
+
+        assert [pet.pet_id for pet in stale] == [pet.pet_id for pet in pets]
+        assert search_agent.is_stale(pet_type="dog", location="Seattle, WA")
+
+        # A successful fetch clears the flag
+        search_agent.cache.clear()
+        await search_agent.search_pets(pet_type="dog", location="Seattle, WA")
+        assert not search_agent.is_stale(pet_type="dog", location="Seattle, WA")
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_resets_stale_flag(self, search_agent):
+        """Test that clearing the cache also drops stale marks."""
+        await search_agent.search_pets(pet_type="dog", location="Seattle, WA")
+        search_agent.cache.clear()
+        with patch.object(
+            search_agent,
+            '_search_rescuegroups',
+            side_effect=Exception("API Error")
+        ):
+            await search_agent.search_pets(pet_type="dog", location="Seattle, WA")
+        assert search_agent.is_stale(pet_type="dog", location="Seattle, WA")
+
+        search_agent.clear_cache()
+
+        assert not search_agent.is_stale(pet_type="dog", location="Seattle, WA")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])